@@ -32,6 +32,11 @@ class WhisperConfig:
     model: str = "medium"          # Model size: tiny, base, small, medium, large
     language: str = "es"           # Target language
     device: str = "auto"           # auto, cuda, cpu
+    backend: str = "openai_whisper"  # openai_whisper, faster_whisper, openvino
+    compute_type: str = "auto"     # faster-whisper weights: auto, int8, int8_float16, float16
+    batch_size: int = 1            # >1 enables batched inference (needs faster-whisper)
+    compile: bool = False          # torch.compile the encoder (openai_whisper on CUDA)
+    weight_cache: bool = True      # Keep an fp16 copy of the weights in models/ (openai_whisper, PyTorch 2.1+)
 
 
 @dataclass
@@ -99,6 +104,16 @@ class Config:
             self.whisper.language = os.environ["BOUT_LANGUAGE"]
         if os.environ.get("BOUT_DEVICE"):
             self.whisper.device = os.environ["BOUT_DEVICE"]
+        if os.environ.get("BOUT_BACKEND"):
+            self.whisper.backend = os.environ["BOUT_BACKEND"]
+        if os.environ.get("BOUT_COMPUTE_TYPE"):
+            self.whisper.compute_type = os.environ["BOUT_COMPUTE_TYPE"]
+        if os.environ.get("BOUT_BATCH_SIZE"):
+            self.whisper.batch_size = int(os.environ["BOUT_BATCH_SIZE"])
+        if os.environ.get("BOUT_COMPILE"):
+            self.whisper.compile = os.environ["BOUT_COMPILE"].lower() in {"1", "true", "yes"}
+        if os.environ.get("BOUT_WEIGHT_CACHE"):
+            self.whisper.weight_cache = os.environ["BOUT_WEIGHT_CACHE"].lower() in {"1", "true", "yes"}
         if os.environ.get("BOUT_LOG_LEVEL"):
             self.log.level = os.environ["BOUT_LOG_LEVEL"]
         if os.environ.get("BOUT_CHUNK_DURATION"):
@@ -3,13 +3,17 @@ Type definitions for BOUT.
 
 Dataclasses for jobs, chunks, and transcription results.
 """
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, InitVar
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 import uuid
 
+from ..logging import get_logger
+
+logger = get_logger("core.types")
+
 
 class JobStatus(str, Enum):
     """Job lifecycle states."""
@@ -33,7 +37,14 @@ class ChunkStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+class WhisperBackend(str, Enum):
+    """Whisper inference backends."""
+    OPENAI_WHISPER = "openai_whisper"    # Reference PyTorch implementation
+    FASTER_WHISPER = "faster_whisper"    # CTranslate2, quantized weights
+    OPENVINO = "openvino"                # Intel OpenVINO, cached compiled model
+
+
+@dataclass(slots=True)
 class TranscriptionSegment:
     """A segment of transcribed text with timing."""
     start: float           # Start time in seconds
@@ -125,9 +136,32 @@ class Job:
 
     # Output
     output_path: Optional[Path] = None
-    transcription_text: Optional[str] = None
+    transcription_path: Optional[Path] = None  # Transcript file (kept out of state)
     segments: List[TranscriptionSegment] = field(default_factory=list)
 
+    # Full transcript text; the Job.transcription_text property below loads it
+    # lazily from transcription_path
+    transcription_text: InitVar[Optional[str]] = None
+    _transcription_text: Optional[str] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self, transcription_text: Optional[str]):
+        self._transcription_text = transcription_text
+
+    def _get_transcription_text(self) -> Optional[str]:
+        """Full transcript text, read from transcription_path on first access."""
+        if self._transcription_text is None and self.transcription_path is not None:
+            try:
+                self._transcription_text = self.transcription_path.read_text(encoding="utf-8")
+            except OSError as e:
+                logger.error(f"Failed to read transcript for job {self.id}: {e}")
+                return None
+        return self._transcription_text
+
+    def _set_transcription_text(self, value: Optional[str]):
+        self._transcription_text = value
+        # The stored file no longer matches; it is rewritten on next save
+        self.transcription_path = None
+
     @property
     def total_chunks(self) -> int:
         """Total number of chunks."""
@@ -167,6 +201,7 @@ class Job:
             "audio_path": str(self.audio_path) if self.audio_path else None,
             "chunks": [c.to_dict() for c in self.chunks],
             "output_path": str(self.output_path) if self.output_path else None,
+            "transcription_path": str(self.transcription_path) if self.transcription_path else None,
             "transcription_text": self.transcription_text,
         }
 
@@ -186,5 +221,15 @@ class Job:
             audio_path=Path(data["audio_path"]) if data.get("audio_path") else None,
             chunks=chunks,
             output_path=Path(data["output_path"]) if data.get("output_path") else None,
+            transcription_path=Path(data["transcription_path"]) if data.get("transcription_path") else None,
             transcription_text=data.get("transcription_text"),
         )
+
+
+# Set after @dataclass: a property in the class body would become the
+# default value of the transcription_text init argument
+Job.transcription_text = property(
+    Job._get_transcription_text,
+    Job._set_transcription_text,
+    doc=Job._get_transcription_text.__doc__,
+)
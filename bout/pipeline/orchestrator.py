@@ -65,6 +65,11 @@ class Orchestrator:
             model_name=self.config.whisper.model,
             language=self.config.whisper.language,
             device=self.config.whisper.device,
+            backend=self.config.whisper.backend,
+            compute_type=self.config.whisper.compute_type,
+            batch_size=self.config.whisper.batch_size,
+            compile_model=self.config.whisper.compile,
+            weight_cache=self.config.whisper.weight_cache,
         )
         self.chunk_merger = ChunkMerger(
             overlap_seconds=self.config.chunk.overlap_seconds,
@@ -122,6 +127,9 @@ class Orchestrator:
                     job.error = str(e)
                     self.state_manager.save_job(job)
                     raise BoutError(f"Pipeline failed: {e}")
+                finally:
+                    # Write the last states and stop the writer thread
+                    self.state_manager.close()
 
     def _execute_pipeline(
         self,
@@ -195,8 +203,9 @@ class Orchestrator:
         job_log.info("Stage 3: Transcribing chunks")
 
         def on_chunk_progress(current, total):
-            reporter.update(completed=current)
-            tracker.complete_chunk(current - 1)
+            with tracker.batch():
+                reporter.update(completed=current)
+                tracker.complete_chunk(current - 1)
 
         def on_chunk_checkpoint(chunk):
             self.state_manager.save_chunk_result(job.id, chunk)
@@ -318,6 +327,8 @@ class Orchestrator:
                     job.error = str(e)
                     self.state_manager.save_job(job)
                     raise
+                finally:
+                    self.state_manager.close()
 
     def _resume_from_status(
         self,
@@ -116,20 +116,19 @@ class ProgressReporter:
                 )
 
     def start_stage(self, stage: Stage, description: str, total: float = 100):
-        """Start a new stage with a fresh progress bar."""
-        self.tracker.start_stage(stage, description, total)
-
+        """Start a new stage, resetting the stage progress bar."""
         if self.progress and self.stage_task_id is not None:
-            # Complete previous stage task
-            self.progress.update(self.stage_task_id, visible=False)
-
-        # Create new stage task
-        if self.progress:
-            self.stage_task_id = self.progress.add_task(
-                f"  {description}",
+            # Reuse the stage task instead of hiding it and adding another,
+            # so hidden tasks don't pile up and get iterated on every render
+            self.progress.reset(
+                self.stage_task_id,
                 total=total,
+                description=f"  {description}",
             )
 
+        # The tracker callback creates the stage task on first use
+        self.tracker.start_stage(stage, description, total)
+
     def update(self, advance: float = 0, completed: Optional[float] = None):
         """Update current stage progress."""
         self.tracker.update_stage(advance=advance, completed=completed)
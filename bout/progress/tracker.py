@@ -3,7 +3,9 @@ Progress tracking for the transcription pipeline.
 
 Tracks progress across multiple stages with weighted contributions to overall progress.
 """
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Optional, Callable, Dict
 from enum import Enum
 
@@ -40,15 +42,21 @@ class StageProgress:
         return self.progress * 100
 
 
-# Stage weights for overall progress calculation
-STAGE_WEIGHTS = {
+# Stage weights for overall progress calculation (read-only)
+STAGE_WEIGHTS = MappingProxyType({
     Stage.EXTRACT: 0.10,     # 10% - Audio extraction
     Stage.CHUNK: 0.05,       # 5% - Chunking
     Stage.TRANSCRIBE: 0.50,  # 50% - Transcription (main work)
     Stage.MERGE: 0.05,       # 5% - Merging results
     Stage.DIARIZE: 0.15,     # 15% - Speaker diarization
     Stage.GENERATE: 0.15,    # 15% - Document generation
-}
+})
+
+_TOTAL_STAGE_WEIGHT = sum(STAGE_WEIGHTS.values())
+
+
+def _noop(tracker: "ProgressTracker"):
+    """Default on_update callback (no reporter attached)."""
 
 
 class ProgressTracker:
@@ -74,7 +82,7 @@ class ProgressTracker:
         """
         self.video_name = video_name
         self.total_duration = total_duration
-        self.on_update = on_update
+        self.on_update: Callable[["ProgressTracker"], None] = on_update or _noop
 
         # Stage tracking
         self.stages: Dict[Stage, StageProgress] = {}
@@ -85,6 +93,10 @@ class ProgressTracker:
         self.total_chunks: int = 0
         self.current_chunk: int = 0
 
+        # Notification batching (see batch())
+        self._in_batch = False
+        self._notify_pending = False
+
     def start_stage(
         self,
         stage: Stage,
@@ -166,7 +178,30 @@ class ProgressTracker:
         if Stage.TRANSCRIBE in self.stages:
             stage = self.stages[Stage.TRANSCRIBE]
             if self.total_chunks > 0:
-                stage.completed = ((chunk_index + 1) / self.total_chunks) * stage.total
+                completed = ((chunk_index + 1) / self.total_chunks) * stage.total
+                if completed != stage.completed:
+                    stage.completed = completed
+                    self._notify()
+
+    @contextmanager
+    def batch(self):
+        """
+        Coalesce progress updates into a single notification.
+
+        Updates made inside the block fire the callback at most once, when
+        the outermost batch exits.
+        """
+        if self._in_batch:
+            yield
+            return
+
+        self._in_batch = True
+        try:
+            yield
+        finally:
+            self._in_batch = False
+            if self._notify_pending:
+                self._notify_pending = False
                 self._notify()
 
     @property
@@ -177,7 +212,6 @@ class ProgressTracker:
         Returns:
             Progress as fraction (0.0 - 1.0)
         """
-        total_weight = sum(STAGE_WEIGHTS.values())
         weighted_sum = 0.0
 
         for stage, weight in STAGE_WEIGHTS.items():
@@ -186,7 +220,7 @@ class ProgressTracker:
             elif stage in self.completed_stages:
                 weighted_sum += weight
 
-        return weighted_sum / total_weight if total_weight > 0 else 0.0
+        return weighted_sum / _TOTAL_STAGE_WEIGHT if _TOTAL_STAGE_WEIGHT > 0 else 0.0
 
     @property
     def overall_percent(self) -> float:
@@ -202,8 +236,10 @@ class ProgressTracker:
 
     def _notify(self):
         """Notify callback of progress update."""
-        if self.on_update:
-            self.on_update(self)
+        if self._in_batch:
+            self._notify_pending = True
+            return
+        self.on_update(self)
 
     def get_status_text(self) -> str:
         """Get a human-readable status string."""
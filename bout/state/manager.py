@@ -2,16 +2,23 @@
 State manager for job persistence and recovery.
 
 Provides:
-- Job state persistence to JSON files
+- Job state persistence to JSON files (written by a background thread)
+- Gzip-compressed state files for completed jobs
+- Transcripts stored in separate text files, written once per change
 - Resume capability for interrupted jobs
 - Cleanup of old/orphaned jobs
 """
+import atexit
+import gzip
 import json
+import os
+import queue
 import shutil
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterator, Tuple
 
 from ..core.types import Job, Chunk, JobStatus, ChunkStatus
 from ..core.exceptions import JobNotFoundError
@@ -20,6 +27,9 @@ from ..logging import get_logger
 
 logger = get_logger("state.manager")
 
+STATE_SUFFIX = ".json"
+COMPRESSED_STATE_SUFFIX = ".json.gz"
+
 
 class StateManager:
     """
@@ -27,6 +37,15 @@ class StateManager:
 
     Uses JSON files for simple, portable state storage.
     Each job has its own state file for isolation.
+
+    Writes are serialized on the caller's thread and handed to a background
+    writer, so checkpoints don't block on disk. Pending writes for the same
+    job are coalesced (last writer wins) and reads see them immediately.
+
+    The writer thread starts with the first save and runs until close().
+
+    Completed jobs are stored gzip-compressed ({job_id}.json.gz); readers
+    accept either format and use the newest file if both exist.
     """
 
     def __init__(self, jobs_dir: Path):
@@ -39,29 +58,221 @@ class StateManager:
         self.jobs_dir = Path(jobs_dir)
         self.jobs_dir.mkdir(parents=True, exist_ok=True)
 
-    def _job_file(self, job_id: str) -> Path:
+        # Newest state saved by this manager, keyed by job ID. Kept after the
+        # write lands so checkpoints don't re-read and re-parse the whole file
+        self._states: Dict[str, dict] = {}
+        # Job ID -> (path, mtime_ns, size) of the file holding _states[job_id].
+        # Missing while a write is pending; a mismatch means another process
+        # wrote the job, so the cached state is ignored
+        self._written: Dict[str, Tuple[Path, int, int]] = {}
+        # Serialized state waiting to be written: job ID -> (compressed, data, state)
+        self._pending: Dict[str, Tuple[bool, bytes, dict]] = {}
+        self._lock = threading.Lock()
+        self._write_q: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+
+    def _job_file(self, job_id: str, compressed: bool = False) -> Path:
         """Get path to job state file."""
-        return self.jobs_dir / f"{job_id}.json"
+        suffix = COMPRESSED_STATE_SUFFIX if compressed else STATE_SUFFIX
+        return self.jobs_dir / f"{job_id}{suffix}"
+
+    def _latest_job_file(self, job_id: str) -> Optional[Path]:
+        """Get the newest existing state file for a job (either format)."""
+        latest = None
+        latest_mtime = -1.0
+        for path in (self._job_file(job_id), self._job_file(job_id, compressed=True)):
+            try:
+                mtime = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if mtime > latest_mtime:
+                latest, latest_mtime = path, mtime
+        return latest
+
+    def _state_files(self) -> Iterator[Tuple[str, Path]]:
+        """Yield (job_id, path) for every state file in jobs_dir."""
+        for suffix in (STATE_SUFFIX, COMPRESSED_STATE_SUFFIX):
+            for path in self.jobs_dir.glob(f"*{suffix}"):
+                yield path.name[:-len(suffix)], path
+
+    def _transcript_file(self, job_id: str) -> Path:
+        """Get path to job transcript file."""
+        return self.jobs_dir / f"{job_id}.transcript.txt"
 
     def save_job(self, job: Job, chunks_dir: Optional[Path] = None):
         """
         Save job state to disk.
 
+        The state is serialized immediately and written in the background.
+
         Args:
             job: Job to save
             chunks_dir: Directory containing chunk files
         """
         job.update()  # Update timestamp
 
+        self._save_transcript(job)
         state = JobState.from_job(job, chunks_dir)
-        job_file = self._job_file(job.id)
+        self._store_state(job.id, state.to_dict())
 
+    def _save_transcript(self, job: Job):
+        """
+        Write the job transcript to its own file if it isn't stored yet.
+
+        Written synchronously so the state file never references a transcript
+        that isn't on disk.
+        """
+        if job.transcription_path is not None or job.transcription_text is None:
+            return
+
+        transcript_file = self._transcript_file(job.id)
         try:
-            with open(job_file, "w", encoding="utf-8") as f:
-                json.dump(state.to_dict(), f, indent=2, ensure_ascii=False)
-            logger.debug(f"Saved job state: {job.id}")
-        except Exception as e:
-            logger.error(f"Failed to save job {job.id}: {e}")
+            self._write_file(transcript_file, job.transcription_text.encode("utf-8"))
+            job.transcription_path = transcript_file
+        except OSError as e:
+            logger.error(f"Failed to save transcript for job {job.id}: {e}")
+
+    def _store_state(self, job_id: str, state: dict):
+        """Serialize a state dict and queue it for the writer thread."""
+        try:
+            data = json.dumps(state, indent=2, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to save job {job_id}: {e}")
+            return
+
+        # Completed jobs are kept around but rarely read; level 1 is nearly free
+        compressed = state.get("status") == JobStatus.COMPLETED.value
+        if compressed:
+            data = gzip.compress(data, compresslevel=1)
+
+        with self._lock:
+            self._states[job_id] = state
+            self._written.pop(job_id, None)
+            queued = job_id in self._pending
+            self._pending[job_id] = (compressed, data, state)
+            if not queued:
+                self._start_writer()
+                self._write_q.put(job_id)
+
+    def _start_writer(self):
+        """Start the writer thread if it isn't running. Call with the lock held."""
+        if self._writer is not None:
+            return
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="bout-state-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.flush)
+
+    def flush(self):
+        """Block until all pending job states have been written."""
+        self._write_q.join()
+
+    def close(self):
+        """
+        Write pending job states and stop the writer thread.
+
+        The manager stays usable: reads go back to disk and the next save starts
+        a new writer. Don't call it while other threads are still saving.
+        """
+        with self._lock:
+            writer, self._writer = self._writer, None
+            if writer is None:
+                return
+            self._write_q.put(None)  # Stop after the queued writes
+        writer.join()
+        atexit.unregister(self.flush)
+        # Everything is on disk now; don't hold every job's state for good
+        with self._lock:
+            self._states.clear()
+            self._written.clear()
+
+    def _writer_loop(self):
+        """Write queued job states to disk (background thread)."""
+        while True:
+            job_id = self._write_q.get()
+            if job_id is None:
+                self._write_q.task_done()
+                return
+            try:
+                # Take the entry before writing: a save that lands meanwhile
+                # finds nothing pending and queues the job again
+                with self._lock:
+                    entry = self._pending.pop(job_id, None)
+                if entry is not None:
+                    compressed, data, state = entry
+                    path = self._job_file(job_id, compressed)
+                    written = None
+                    try:
+                        self._write_file(path, data)
+                        # Drop the other format so it can't shadow this state
+                        self._job_file(job_id, not compressed).unlink(missing_ok=True)
+                        stat = path.stat()
+                        written = (path, stat.st_mtime_ns, stat.st_size)
+                        logger.debug(f"Saved job state: {job_id}")
+                    finally:
+                        # Unless a newer save is pending, remember which file
+                        # holds the cached state, or forget a state that
+                        # never reached disk
+                        with self._lock:
+                            if self._states.get(job_id) is state:
+                                if written is not None:
+                                    self._written[job_id] = written
+                                else:
+                                    del self._states[job_id]
+            except Exception as e:
+                logger.error(f"Failed to save job {job_id}: {e}")
+            finally:
+                self._write_q.task_done()
+
+    def _write_file(self, path: Path, data: bytes):
+        """Atomically replace a file with the given contents."""
+        tmp_file = path.with_name(path.name + ".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, path)
+
+    def _read_state(self, job_id: str) -> Optional[dict]:
+        """Read raw job state, preferring the state this manager saved last."""
+        with self._lock:
+            state = self._states.get(job_id)
+            written = self._written.get(job_id)
+        if state is not None and written is None:
+            return dict(state)  # Write still pending
+
+        path = self._latest_job_file(job_id)
+        if path is None:
+            return None
+        if state is not None and path == written[0]:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                return None
+            if (stat.st_mtime_ns, stat.st_size) == written[1:]:
+                return dict(state)
+        return self._read_state_file(path)
+
+    def _read_state_file(self, path: Path) -> Optional[dict]:
+        """
+        Read a job state file (plain or gzip-compressed).
+
+        Returns None if the file is missing or unreadable. Errors while
+        building objects from the data are left to the caller.
+        """
+        opener = gzip.open if path.name.endswith(COMPRESSED_STATE_SUFFIX) else open
+        try:
+            with opener(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        # ValueError: bad JSON or encoding; EOFError: truncated gzip
+        except (OSError, ValueError, EOFError) as e:
+            self._log_read_error(path, e)
+            return None
+
+    def _log_read_error(self, path: Path, error: Exception):
+        """Log a state file that exists but could not be read."""
+        logger.error(f"Failed to read job state {path.name}: {error}")
 
     def load_job(self, job_id: str) -> Optional[Job]:
         """
@@ -73,19 +284,10 @@ class StateManager:
         Returns:
             Job object or None if not found
         """
-        job_file = self._job_file(job_id)
-
-        if not job_file.exists():
-            return None
-
-        try:
-            with open(job_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            state = JobState.from_dict(data)
-            return state.to_job()
-        except Exception as e:
-            logger.error(f"Failed to load job {job_id}: {e}")
+        data = self._read_state(job_id)
+        if data is None:
             return None
+        return JobState.from_dict(data).to_job()
 
     def get_job(self, job_id: str) -> Optional[Job]:
         """
@@ -109,18 +311,10 @@ class StateManager:
         Returns:
             JobState or None if not found
         """
-        job_file = self._job_file(job_id)
-
-        if not job_file.exists():
-            return None
-
-        try:
-            with open(job_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return JobState.from_dict(data)
-        except Exception as e:
-            logger.error(f"Failed to load job state {job_id}: {e}")
+        data = self._read_state(job_id)
+        if data is None:
             return None
+        return JobState.from_dict(data)
 
     def get_all_jobs(self) -> List[Job]:
         """
@@ -129,10 +323,18 @@ class StateManager:
         Returns:
             List of all jobs, sorted by created_at (newest first)
         """
+        with self._lock:
+            job_ids = set(self._states)
+        job_ids.update(job_id for job_id, _ in self._state_files())
+
         jobs = []
-        for job_file in self.jobs_dir.glob("*.json"):
-            job_id = job_file.stem
-            job = self.load_job(job_id)
+        for job_id in job_ids:
+            # One file with a bad schema shouldn't hide every other job
+            try:
+                job = self.load_job(job_id)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.error(f"Skipping invalid job state {job_id}: {e!r}")
+                continue
             if job:
                 jobs.append(job)
 
@@ -159,7 +361,7 @@ class StateManager:
 
     def delete_job(self, job_id: str) -> bool:
         """
-        Delete job state file.
+        Delete job state and transcript files.
 
         Args:
             job_id: Job ID to delete
@@ -167,17 +369,25 @@ class StateManager:
         Returns:
             True if deleted
         """
-        job_file = self._job_file(job_id)
+        # Let pending writes land first so they can't recreate the file
+        self.flush()
+        with self._lock:
+            self._states.pop(job_id, None)
+            self._written.pop(job_id, None)
 
+        deleted = False
         try:
-            if job_file.exists():
-                job_file.unlink()
+            self._transcript_file(job_id).unlink(missing_ok=True)
+            for job_file in (self._job_file(job_id), self._job_file(job_id, compressed=True)):
+                if job_file.exists():
+                    job_file.unlink()
+                    deleted = True
+            if deleted:
                 logger.debug(f"Deleted job: {job_id}")
-                return True
         except Exception as e:
             logger.error(f"Failed to delete job {job_id}: {e}")
 
-        return False
+        return deleted
 
     def update_job_status(self, job_id: str, status: JobStatus, error: Optional[str] = None):
         """
@@ -198,21 +408,32 @@ class StateManager:
         """
         Save a single chunk result (checkpoint).
 
+        Only the given chunk is re-serialized; the other chunk entries are
+        reused as-is from the stored state. Checkpoints that don't change the
+        stored chunk (e.g. retries) are skipped.
+
         Args:
             job_id: Job ID
             chunk: Completed chunk
         """
-        job = self.load_job(job_id)
-        if not job:
+        state = self._read_state(job_id)
+        if state is None:
             return
 
         # Update chunk in job
-        for i, c in enumerate(job.chunks):
-            if c.index == chunk.index:
-                job.chunks[i] = chunk
+        chunk_data = chunk.to_dict()
+        chunks = list(state.get("chunks", []))
+        for i, c in enumerate(chunks):
+            if c.get("index") == chunk.index:
+                if c == chunk_data:
+                    logger.debug(f"Checkpoint unchanged: job {job_id}, chunk {chunk.index}")
+                    return
+                chunks[i] = chunk_data
                 break
 
-        self.save_job(job)
+        state["chunks"] = chunks
+        state["updated_at"] = datetime.now().isoformat()
+        self._store_state(job_id, state)
         logger.debug(f"Checkpoint: job {job_id}, chunk {chunk.index}")
 
     def cleanup_old_jobs(
@@ -233,13 +454,13 @@ class StateManager:
         cleaned = 0
         now = time.time()
 
-        for job_file in self.jobs_dir.glob("*.json"):
+        for job_id, job_file in self._state_files():
             try:
                 mtime = job_file.stat().st_mtime
                 age = now - mtime
 
                 if age > max_age_seconds:
-                    job = self.load_job(job_file.stem)
+                    job = self.load_job(job_id)
                     if job and job.status in {JobStatus.COMPLETED, JobStatus.FAILED}:
                         if not dry_run:
                             self.delete_job(job.id)
@@ -3,20 +3,25 @@ State models for job persistence.
 
 Extends core types with serialization support.
 """
-from dataclasses import dataclass, field
+import os
+from dataclasses import dataclass, field, fields, MISSING
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple, Union
 
+from ..core.config import Config, get_config
 from ..core.types import Job, Chunk, JobStatus
 
+PathLike = Union[str, os.PathLike]
 
-@dataclass
+
+@dataclass(slots=True)
 class JobState:
     """
     Serializable job state for persistence.
 
-    Includes all data needed to resume a job.
+    Includes all data needed to resume a job. Path fields accept any
+    path-like value but are always held as strings.
     """
     # Job identity
     job_id: str
@@ -42,8 +47,18 @@ class JobState:
 
     # Output
     output_path: Optional[str] = None
+    transcription_path: Optional[str] = None
+
+    # Inline transcript (older state files; new saves use transcription_path)
     transcription_text: Optional[str] = None
 
+    def __post_init__(self):
+        """Normalize path-like fields to strings."""
+        for name in _PATH_FIELDS:
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, str):
+                setattr(self, name, os.fspath(value))
+
     def to_job(self) -> Job:
         """Convert to Job object."""
         job = Job(
@@ -58,71 +73,77 @@ class JobState:
             audio_path=Path(self.audio_path) if self.audio_path else None,
             chunks=[Chunk.from_dict(c) for c in self.chunks],
             output_path=Path(self.output_path) if self.output_path else None,
+            transcription_path=Path(self.transcription_path) if self.transcription_path else None,
             transcription_text=self.transcription_text,
         )
         return job
 
     @classmethod
-    def from_job(cls, job: Job, chunks_dir: Optional[Path] = None) -> "JobState":
+    def from_job(cls, job: Job, chunks_dir: Optional[PathLike] = None) -> "JobState":
         """Create from Job object."""
-        from ..core.config import get_config
-        config = get_config()
-
         return cls(
             job_id=job.id,
-            video_path=str(job.video_path) if job.video_path else "",
+            video_path=_fspath(job.video_path) or "",
             video_name=job.video_name,
             created_at=job.created_at.isoformat(),
             updated_at=job.updated_at.isoformat(),
             duration_seconds=job.duration_seconds,
             status=job.status.value,
             error=job.error,
-            audio_path=str(job.audio_path) if job.audio_path else None,
-            chunks_dir=str(chunks_dir) if chunks_dir else None,
-            chunk_config={
-                "duration_seconds": config.chunk.duration_seconds,
-                "overlap_seconds": config.chunk.overlap_seconds,
-            },
+            audio_path=_fspath(job.audio_path),
+            chunks_dir=_fspath(chunks_dir),
+            chunk_config=_chunk_config(),
             chunks=[c.to_dict() for c in job.chunks],
-            output_path=str(job.output_path) if job.output_path else None,
-            transcription_text=job.transcription_text,
+            output_path=_fspath(job.output_path),
+            transcription_path=_fspath(job.transcription_path),
+            # Only kept inline if the transcript file couldn't be written
+            transcription_text=job.transcription_text if job.transcription_path is None else None,
         )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "job_id": self.job_id,
-            "video_path": self.video_path,
-            "video_name": self.video_name,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "duration_seconds": self.duration_seconds,
-            "status": self.status,
-            "error": self.error,
-            "audio_path": self.audio_path,
-            "chunks_dir": self.chunks_dir,
-            "chunk_config": self.chunk_config,
-            "chunks": self.chunks,
-            "output_path": self.output_path,
-            "transcription_text": self.transcription_text,
-        }
+        return {k: getattr(self, k) for k in _FIELDS}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "JobState":
         """Create from dictionary."""
-        return cls(
-            job_id=data["job_id"],
-            video_path=data["video_path"],
-            video_name=data["video_name"],
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
-            duration_seconds=data.get("duration_seconds", 0.0),
-            status=data["status"],
-            error=data.get("error"),
-            audio_path=data.get("audio_path"),
-            chunks_dir=data.get("chunks_dir"),
-            chunk_config=data.get("chunk_config", {}),
-            chunks=data.get("chunks", []),
-            output_path=data.get("output_path"),
-            transcription_text=data.get("transcription_text"),
-        )
+        return cls(**{
+            k: data[k] if k in data or k not in _DEFAULTS else _DEFAULTS[k]()
+            for k in _FIELDS
+        })
+
+
+# Field names in declaration order (also the on-disk key order)
+_FIELDS = tuple(f.name for f in fields(JobState))
+
+# Factories for keys that may be missing from older state files.
+# Required fields without an entry here raise KeyError in from_dict.
+_DEFAULTS: Dict[str, Callable[[], Any]] = {"duration_seconds": float}
+for _f in fields(JobState):
+    if _f.default_factory is not MISSING:
+        _DEFAULTS[_f.name] = _f.default_factory
+    elif _f.default is not MISSING:
+        _DEFAULTS[_f.name] = lambda _v=_f.default: _v
+del _f
+
+_PATH_FIELDS = ("video_path", "audio_path", "chunks_dir", "output_path", "transcription_path")
+
+# Chunk settings recorded with each state, cached per Config instance
+_chunk_config_cache: Optional[Tuple[Config, Dict[str, Any]]] = None
+
+
+def _fspath(path: Optional[PathLike]) -> Optional[str]:
+    """Return the string form of a path (no copy for str), or None."""
+    return os.fspath(path) if path else None
+
+
+def _chunk_config() -> Dict[str, Any]:
+    """Get the chunking parameters stored alongside job state."""
+    global _chunk_config_cache
+    config = get_config()
+    if _chunk_config_cache is None or _chunk_config_cache[0] is not config:
+        _chunk_config_cache = (config, {
+            "duration_seconds": config.chunk.duration_seconds,
+            "overlap_seconds": config.chunk.overlap_seconds,
+        })
+    return _chunk_config_cache[1]
@@ -3,18 +3,49 @@ Whisper transcription engine.
 
 Provides chunked transcription with memory management.
 """
-import gc
+import os
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable, List, Dict, Any
+from typing import Optional, Callable, List, Dict, Any, Union
 
 from ..core.config import get_config
-from ..core.types import Chunk, ChunkStatus, TranscriptionSegment
+from ..core.types import Chunk, ChunkStatus, TranscriptionSegment, WhisperBackend
 from ..core.exceptions import ModelLoadError, OutOfMemoryError, TranscriptionError
-from ..utils.system import cleanup_gpu_memory, get_memory_info
+from ..utils.system import cleanup_gpu_memory, get_memory_info, get_gpu_reserved_fraction
 from ..logging import get_logger
 
 logger = get_logger("transcription.engine")
 
+# Hugging Face model IDs for the OpenVINO backend
+OPENVINO_MODEL_IDS = {
+    "large": "openai/whisper-large-v3",
+}
+
+# Below this much free VRAM, faster-whisper uses int8 instead of int8_float16
+INT8_VRAM_THRESHOLD_MB = 5000
+
+# Release cached GPU memory every N chunks, or sooner under memory pressure
+GPU_CLEANUP_INTERVAL = 20
+GPU_RESERVED_THRESHOLD = 0.9
+
+# After this many chunks in a row fall back to CPU on OOM, send the next
+# OOM_CPU_CHUNKS chunks straight to CPU instead of retrying the GPU first
+OOM_STREAK_LIMIT = 3
+OOM_CPU_CHUNKS = 10
+
+# Whisper pads every input to a 30 s window, so consecutive chunks shorter
+# than that are packed (separated by a short silence) into one forward pass
+WHISPER_WINDOW_SECONDS = 30.0
+PACK_GAP_SECONDS = 0.5
+SAMPLE_RATE = 16000
+
+
+def _torch_version(torch) -> tuple:
+    """Get the (major, minor) version of an imported torch module."""
+    return tuple(int(v) for v in torch.__version__.split("+")[0].split(".")[:2])
+
 
 class TranscriptionEngine:
     """
@@ -22,8 +53,12 @@ class TranscriptionEngine:
 
     Features:
     - Lazy model loading
+    - openai-whisper, faster-whisper (CTranslate2, int8) or OpenVINO backends
+    - Optional batched inference via faster-whisper
     - GPU memory management
     - Per-chunk transcription with checkpointing
+    - Audio decoding of the next chunk overlapped with transcription
+    - Short chunks packed into a single 30 s Whisper window
     - Automatic OOM recovery
     """
 
@@ -32,6 +67,11 @@ class TranscriptionEngine:
         model_name: str = "medium",
         language: str = "es",
         device: str = "auto",
+        backend: str = WhisperBackend.OPENAI_WHISPER.value,
+        compute_type: str = "auto",
+        batch_size: int = 1,
+        compile_model: bool = False,
+        weight_cache: bool = True,
     ):
         """
         Initialize transcription engine.
@@ -40,13 +80,32 @@ class TranscriptionEngine:
             model_name: Whisper model (tiny, base, small, medium, large)
             language: Target language code
             device: Processing device (auto, cuda, cpu)
+            backend: Inference backend (openai_whisper, faster_whisper, openvino)
+            compute_type: faster-whisper weight type, or "auto" to pick
+                int8_float16 on GPU (int8 on small GPUs) and int8 on CPU
+            batch_size: Audio windows decoded per forward pass. Values above 1
+                use faster-whisper's batched pipeline when it is installed.
+            compile_model: torch.compile the Whisper encoder (openai_whisper
+                backend on CUDA, PyTorch 2.1+); falls back to eager on failure
+            weight_cache: Load openai-whisper weights from a local fp16 copy
+                (written on first load, PyTorch 2.1+)
         """
         self.model_name = model_name
         self.language = language
         self.requested_device = device
+        self.backend = WhisperBackend(backend)
+        self.compute_type = compute_type
+        self.batch_size = batch_size
+        self.compile_model = compile_model
+        self.weight_cache = weight_cache
 
         self.model = None
+        self.cpu_model = None  # openai-whisper CPU model for OOM fallback
         self.device = None
+        self.loaded_backend: Optional[WhisperBackend] = None  # Backend of self.model
+
+        self._consecutive_oom = 0  # Chunks in a row that fell back to CPU
+        self._gpu_disabled_until_chunk = -1  # Chunks below this index skip the GPU
 
     def _detect_device(self) -> str:
         """Detect best available device."""
@@ -59,6 +118,7 @@ class TranscriptionEngine:
                 mem = get_memory_info()
                 if mem.gpu_available_mb and mem.gpu_available_mb > 1000:
                     logger.info(f"Using GPU: {mem.gpu_name}")
+                    logger.debug(f"CUDA allocator: {os.environ.get('PYTORCH_CUDA_ALLOC_CONF')}")
                     return "cuda"
         except ImportError:
             pass
@@ -81,18 +141,245 @@ class TranscriptionEngine:
         logger.info(f"Loading Whisper model '{self.model_name}' on {self.device}")
 
         try:
-            import whisper
-            self.model = whisper.load_model(self.model_name, device=self.device)
+            if self.backend == WhisperBackend.OPENVINO:
+                self.model = self._load_openvino()
+                if self.model is not None:
+                    self.loaded_backend = WhisperBackend.OPENVINO
+            elif self.backend == WhisperBackend.FASTER_WHISPER or self.batch_size > 1:
+                self.model = self._load_faster_whisper()
+                if self.model is not None:
+                    self.loaded_backend = WhisperBackend.FASTER_WHISPER
+
+            if self.model is None:
+                self.model = self._load_openai_whisper()
+                self.loaded_backend = WhisperBackend.OPENAI_WHISPER
+                if self.compile_model and self.device == "cuda":
+                    self._compile_encoder()
             logger.info("Model loaded successfully")
 
         except Exception as e:
             raise ModelLoadError(self.model_name, str(e))
 
+    def _load_openai_whisper(self):
+        """
+        Load an openai-whisper model, using a local state_dict cache.
+
+        The first load goes through whisper.load_model and saves the weights
+        in fp16 (like whisper's own checkpoints) to base_dir/models/whisper,
+        keyed by model name and whisper version. Later loads memory-map that
+        file on the CPU and assign the tensors to a model built on the meta
+        device, so the checkpoint is never read into RAM before the model is
+        moved to the device and converted to fp32.
+
+        Without weight_cache, or on PyTorch before 2.1 (no mmap in torch.load),
+        this is plain whisper.load_model.
+        """
+        import torch
+        import whisper
+
+        if not self.weight_cache:
+            return whisper.load_model(self.model_name, device=self.device)
+        if _torch_version(torch) < (2, 1):
+            logger.debug(f"Weight cache needs PyTorch 2.1+, found {torch.__version__}")
+            return whisper.load_model(self.model_name, device=self.device)
+
+        cache_dir = get_config().base_dir / "models" / "whisper"
+        cache_path = cache_dir / f"{self.model_name}@{whisper.__version__}.pt"
+
+        if cache_path.exists():
+            try:
+                checkpoint = torch.load(
+                    cache_path, map_location="cpu", mmap=True, weights_only=True
+                )
+                # Whisper.__init__ builds its alignment-heads buffer with
+                # to_sparse(), which has no meta kernel; build the parts here
+                dims = whisper.model.ModelDimensions(**checkpoint["dims"])
+                model = whisper.model.Whisper.__new__(whisper.model.Whisper)
+                torch.nn.Module.__init__(model)
+                model.dims = dims
+                with torch.device("meta"):
+                    model.encoder = whisper.model.AudioEncoder(
+                        dims.n_mels, dims.n_audio_ctx, dims.n_audio_state,
+                        dims.n_audio_head, dims.n_audio_layer,
+                    )
+                    model.decoder = whisper.model.TextDecoder(
+                        dims.n_vocab, dims.n_text_ctx, dims.n_text_state,
+                        dims.n_text_head, dims.n_text_layer,
+                    )
+                model.load_state_dict(checkpoint["model_state_dict"], assign=True)
+                # Non-persistent buffers aren't in the state_dict; rebuild them
+                n_ctx = model.dims.n_text_ctx
+                model.decoder.register_buffer(
+                    "mask", torch.full((n_ctx, n_ctx), float("-inf")).triu_(1), persistent=False
+                )
+                model.register_buffer(
+                    "alignment_heads", checkpoint["alignment_heads"].to_sparse(), persistent=False
+                )
+                if any(t.is_meta for t in (*model.parameters(), *model.buffers())):
+                    raise RuntimeError("cache is missing model tensors")
+                logger.debug(f"Loaded cached weights from {cache_path}")
+                # whisper.load_model gives fp32 weights; convert on the device
+                return model.to(self.device).float()
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable model cache {cache_path}: {e}")
+
+        model = whisper.load_model(self.model_name, device=self.device)
+
+        if not cache_path.exists():
+            tmp_path = cache_path.with_suffix(".tmp")
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                state_dict = {
+                    name: t.to("cpu", torch.float16) if t.is_floating_point() else t.cpu()
+                    for name, t in model.state_dict().items()
+                }
+                torch.save(
+                    {
+                        "dims": vars(model.dims),
+                        "model_state_dict": state_dict,
+                        "alignment_heads": model.alignment_heads.to_dense().cpu(),
+                    },
+                    tmp_path,
+                )
+                os.replace(tmp_path, cache_path)
+                # Drop caches written by other whisper versions
+                old_paths = [cache_dir / f"{self.model_name}.pt"]
+                old_paths += cache_dir.glob(f"{self.model_name}@*.pt")
+                for old_path in old_paths:
+                    if old_path != cache_path:
+                        old_path.unlink(missing_ok=True)
+            except (OSError, RuntimeError) as e:
+                logger.warning(f"Could not cache model weights: {e}")
+                tmp_path.unlink(missing_ok=True)
+
+        return model
+
+    def _compile_encoder(self):
+        """
+        Compile the Whisper encoder with torch.compile and warm it up.
+
+        The encoder always sees a fixed (1, n_mels, 3000) input, so it
+        compiles to a single graph. The decoder is left eager: its kv-cache
+        hooks change shapes on every token. Any failure (old PyTorch, no
+        Triton) keeps the eager encoder.
+        """
+        import torch
+
+        if _torch_version(torch) < (2, 1):
+            logger.debug(f"torch.compile needs PyTorch 2.1+, found {torch.__version__}")
+            return
+
+        eager_encoder = self.model.encoder
+        try:
+            self.model.encoder = torch.compile(
+                eager_encoder, mode="reduce-overhead", fullgraph=True
+            )
+            # Trigger compilation now rather than on the first real chunk
+            n_mels = self.model.dims.n_mels
+            with torch.inference_mode():
+                self.model.encoder(
+                    torch.zeros(1, n_mels, 3000, device=self.device, dtype=torch.float16)
+                )
+            logger.info("Compiled Whisper encoder")
+        except Exception as e:
+            self.model.encoder = eager_encoder
+            logger.warning(f"torch.compile failed, using eager encoder: {e}")
+
+    def _resolve_compute_type(self) -> str:
+        """Pick the faster-whisper compute type for the current device."""
+        if self.compute_type != "auto":
+            return self.compute_type
+        if self.device != "cuda":
+            return "int8"
+
+        mem = get_memory_info()
+        if mem.gpu_available_mb is not None and mem.gpu_available_mb < INT8_VRAM_THRESHOLD_MB:
+            return "int8"
+        return "int8_float16"
+
+    def _load_faster_whisper(self):
+        """
+        Load a faster-whisper (CTranslate2) model.
+
+        With batch_size > 1 the model is wrapped in a batched pipeline that
+        splits each chunk into 30s windows and decodes batch_size of them per
+        forward pass.
+
+        Returns:
+            WhisperModel or BatchedInferencePipeline, or None if faster-whisper
+            is not installed
+        """
+        try:
+            from faster_whisper import WhisperModel, BatchedInferencePipeline
+        except ImportError:
+            logger.warning("faster-whisper not installed, falling back to openai-whisper")
+            return None
+
+        compute_type = self._resolve_compute_type()
+        model = WhisperModel(
+            self.model_name,
+            device=self.device,
+            compute_type=compute_type,
+            cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+        )
+        logger.info(f"Using faster-whisper ({compute_type})")
+
+        if self.batch_size > 1:
+            logger.info(f"Using batched inference (batch size {self.batch_size})")
+            return BatchedInferencePipeline(model=model)
+        return model
+
+    def _load_openvino(self):
+        """
+        Load Whisper through OpenVINO with on-disk caching.
+
+        The first run exports the Hugging Face checkpoint to OpenVINO IR under
+        models/openvino/ and OpenVINO caches the compiled model in
+        models/ov_cache/, so later launches skip both export and compilation.
+
+        Returns:
+            transformers ASR pipeline, or None if optimum-intel is not installed
+        """
+        try:
+            from optimum.intel import OVModelForSpeechSeq2Seq
+            from transformers import AutoProcessor, pipeline
+        except ImportError:
+            logger.warning("optimum-intel not installed, falling back to openai-whisper")
+            return None
+
+        models_dir = get_config().base_dir / "models"
+        ir_dir = models_dir / "openvino" / self.model_name
+        ov_config = {"CACHE_DIR": str(models_dir / "ov_cache")}
+
+        if ir_dir.exists():
+            model = OVModelForSpeechSeq2Seq.from_pretrained(ir_dir, ov_config=ov_config)
+            processor = AutoProcessor.from_pretrained(ir_dir)
+        else:
+            model_id = OPENVINO_MODEL_IDS.get(self.model_name, f"openai/whisper-{self.model_name}")
+            logger.info(f"Exporting {model_id} to OpenVINO (first run only)")
+            model = OVModelForSpeechSeq2Seq.from_pretrained(
+                model_id, export=True, ov_config=ov_config
+            )
+            processor = AutoProcessor.from_pretrained(model_id)
+            model.save_pretrained(ir_dir)
+            processor.save_pretrained(ir_dir)
+
+        logger.info("Using OpenVINO")
+        return pipeline(
+            "automatic-speech-recognition",
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            chunk_length_s=30,
+        )
+
     def unload_model(self):
-        """Unload model and free memory."""
+        """Unload models and free memory."""
+        self.cpu_model = None
         if self.model is not None:
             del self.model
             self.model = None
+            self.loaded_backend = None
             cleanup_gpu_memory()
             logger.debug("Model unloaded")
 
@@ -100,6 +387,7 @@ class TranscriptionEngine:
         self,
         chunk: Chunk,
         max_retries: int = 3,
+        audio: Optional[Any] = None,
     ) -> Chunk:
         """
         Transcribe a single audio chunk.
@@ -107,6 +395,8 @@ class TranscriptionEngine:
         Args:
             chunk: Chunk with file_path set
             max_retries: Number of retries on OOM
+            audio: Pre-decoded 16 kHz waveform of the chunk (see _load_audio);
+                read from file_path if None
 
         Returns:
             Updated chunk with transcription
@@ -117,41 +407,30 @@ class TranscriptionEngine:
         if chunk.file_path is None or not chunk.file_path.exists():
             raise TranscriptionError(f"Chunk file not found: {chunk.file_path}")
 
+        if chunk.index < self._gpu_disabled_until_chunk:
+            return self._transcribe_on_cpu(chunk)
+
         self.load_model()
 
         logger.debug(f"Transcribing chunk {chunk.index}: {chunk.file_path.name}")
 
         for attempt in range(max_retries):
             try:
-                # Clean up before each attempt
-                cleanup_gpu_memory()
-
-                result = self.model.transcribe(
-                    str(chunk.file_path),
-                    language=self.language,
-                    task="transcribe",
-                    verbose=False,
-                )
-
-                # Extract segments
-                segments = []
-                for seg in result.get("segments", []):
-                    # Adjust times relative to original audio
-                    start = chunk.start_time + seg["start"]
-                    end = chunk.start_time + seg["end"]
+                result = self._run_model(chunk.file_path if audio is None else audio)
 
-                    segments.append(TranscriptionSegment(
-                        start=start,
-                        end=end,
-                        text=seg["text"].strip(),
-                    ))
+                # Extract segments, adjusting times relative to original audio
+                st = chunk.start_time
+                segments = [
+                    TranscriptionSegment(start=st + seg["start"], end=st + seg["end"], text=seg["text"].strip())
+                    for seg in result.get("segments", ())
+                ]
 
                 chunk.text = result.get("text", "").strip()
                 chunk.segments = segments
                 chunk.status = ChunkStatus.COMPLETED
 
-                from datetime import datetime
                 chunk.completed_at = datetime.now()
+                self._consecutive_oom = 0
 
                 logger.debug(f"Chunk {chunk.index} transcribed: {len(chunk.text)} chars")
                 return chunk
@@ -164,7 +443,16 @@ class TranscriptionEngine:
                     if attempt == max_retries - 1:
                         # Last resort: try on CPU
                         if self.device != "cpu":
-                            logger.warning("Falling back to CPU for this chunk")
+                            self._consecutive_oom += 1
+                            if self._consecutive_oom >= OOM_STREAK_LIMIT:
+                                logger.warning(
+                                    f"{self._consecutive_oom} OOMs in a row, using CPU "
+                                    f"for the next {OOM_CPU_CHUNKS} chunks"
+                                )
+                                self._gpu_disabled_until_chunk = chunk.index + 1 + OOM_CPU_CHUNKS
+                                self._consecutive_oom = 0
+                            else:
+                                logger.warning("Falling back to CPU for this chunk")
                             return self._transcribe_on_cpu(chunk)
                         raise OutOfMemoryError()
                 else:
@@ -174,10 +462,198 @@ class TranscriptionEngine:
         chunk.error = "Max retries exceeded"
         return chunk
 
+    def _load_audio(self, audio_path: Path):
+        """
+        Decode an audio file to a 16 kHz mono float32 waveform.
+
+        Uses the decoder of the loaded backend. Safe to call from a worker
+        thread while the model is busy with another chunk.
+        """
+        if self.loaded_backend == WhisperBackend.FASTER_WHISPER:
+            from faster_whisper import decode_audio
+            return decode_audio(str(audio_path))
+
+        import whisper
+        return whisper.load_audio(str(audio_path))
+
+    def _load_pack_audio(self, pack: List[Chunk]):
+        """
+        Decode a pack of chunks into one waveform.
+
+        Chunks are joined with PACK_GAP_SECONDS of silence between them.
+
+        Args:
+            pack: Chunks to decode, in order
+
+        Returns:
+            Tuple of (waveform, start offset in seconds of each chunk)
+        """
+        if len(pack) == 1:
+            return self._load_audio(pack[0].file_path), [0.0]
+
+        import numpy as np
+
+        gap = np.zeros(int(PACK_GAP_SECONDS * SAMPLE_RATE), dtype=np.float32)
+        parts = []
+        offsets = []
+        position = 0
+        for chunk in pack:
+            if parts:
+                parts.append(gap)
+                position += len(gap)
+            audio = self._load_audio(chunk.file_path)
+            offsets.append(position / SAMPLE_RATE)
+            parts.append(audio)
+            position += len(audio)
+
+        return np.concatenate(parts), offsets
+
+    def _prefetch_audio(self, executor: ThreadPoolExecutor, pack: Optional[List[Chunk]]) -> Optional[Future]:
+        """Start decoding a pack's audio in the background."""
+        if pack is None or any(c.file_path is None for c in pack):
+            return None
+        return executor.submit(self._load_pack_audio, pack)
+
+    @staticmethod
+    def _pack_chunks(chunks: List[Chunk]) -> List[List[Chunk]]:
+        """
+        Group consecutive short chunks that fit in one Whisper window.
+
+        Args:
+            chunks: Chunks to transcribe, in order
+
+        Returns:
+            List of packs; chunks too long to share a window are alone
+        """
+        packs: List[List[Chunk]] = []
+        current: List[Chunk] = []
+        current_seconds = 0.0
+
+        for chunk in chunks:
+            duration = chunk.end_time - chunk.start_time
+            packed_seconds = current_seconds + PACK_GAP_SECONDS + duration if current else duration
+
+            if current and packed_seconds <= WHISPER_WINDOW_SECONDS:
+                current.append(chunk)
+                current_seconds = packed_seconds
+                continue
+
+            if current:
+                packs.append(current)
+            if duration < WHISPER_WINDOW_SECONDS:
+                current = [chunk]
+                current_seconds = duration
+            else:
+                packs.append([chunk])
+                current = []
+                current_seconds = 0.0
+
+        if current:
+            packs.append(current)
+        return packs
+
+    def _transcribe_pack(self, pack: List[Chunk], audio: Any, offsets: List[float]) -> List[Chunk]:
+        """
+        Transcribe several short chunks in one model call.
+
+        Segments are assigned back to the chunk whose audio they start in.
+        If the packed call fails, each chunk is transcribed on its own.
+
+        Args:
+            pack: Chunks packed into audio
+            audio: Packed waveform from _load_pack_audio
+            offsets: Start offset in seconds of each chunk within audio
+
+        Returns:
+            The updated chunks
+        """
+        if pack[0].index < self._gpu_disabled_until_chunk:
+            return [self.transcribe_chunk(chunk) for chunk in pack]
+
+        self.load_model()
+
+        logger.debug(f"Transcribing chunks {pack[0].index}-{pack[-1].index} in one pass")
+
+        try:
+            result = self._run_model(audio)
+        except RuntimeError as e:
+            logger.debug(f"Packed transcription failed ({e}), transcribing chunks separately")
+            return [self.transcribe_chunk(chunk) for chunk in pack]
+
+        per_chunk: List[List[TranscriptionSegment]] = [[] for _ in pack]
+        for seg in result.get("segments", []):
+            k = max(bisect_right(offsets, seg["start"]) - 1, 0)
+            shift = pack[k].start_time - offsets[k]
+            per_chunk[k].append(TranscriptionSegment(
+                start=seg["start"] + shift,
+                end=seg["end"] + shift,
+                text=seg["text"].strip(),
+            ))
+
+        now = datetime.now()
+        for chunk, segments in zip(pack, per_chunk):
+            chunk.text = " ".join(s.text for s in segments if s.text)
+            chunk.segments = segments
+            chunk.status = ChunkStatus.COMPLETED
+            chunk.completed_at = now
+        self._consecutive_oom = 0
+
+        return pack
+
+    def _run_model(self, audio: Union[Path, Any]) -> Dict[str, Any]:
+        """
+        Transcribe audio with the loaded model.
+
+        Args:
+            audio: Audio file path or decoded waveform
+
+        Returns:
+            Whisper-style result dict with "text" and "segments"
+        """
+        if isinstance(audio, Path):
+            audio = str(audio)
+
+        if self.loaded_backend == WhisperBackend.OPENVINO:
+            result = self.model(
+                audio,
+                return_timestamps=True,
+                generate_kwargs={"language": self.language, "task": "transcribe"},
+            )
+            segments = [
+                {"start": c["timestamp"][0], "end": c["timestamp"][1] or c["timestamp"][0], "text": c["text"]}
+                for c in result.get("chunks", [])
+            ]
+            return {"text": result.get("text", ""), "segments": segments}
+
+        if self.loaded_backend != WhisperBackend.FASTER_WHISPER:
+            return self.model.transcribe(
+                audio,
+                language=self.language,
+                task="transcribe",
+                verbose=False,
+            )
+
+        options = {"batch_size": self.batch_size} if self.batch_size > 1 else {}
+        segments, _ = self.model.transcribe(
+            audio,
+            language=self.language,
+            task="transcribe",
+            beam_size=1,
+            **options,
+        )
+        segments = [{"start": s.start, "end": s.end, "text": s.text} for s in segments]
+        return {
+            "text": "".join(s["text"] for s in segments),
+            "segments": segments,
+        }
+
     def _transcribe_on_cpu(self, chunk: Chunk) -> Chunk:
         """
         Transcribe chunk on CPU as fallback.
 
+        The CPU model is loaded on first use and kept for later fallbacks;
+        the GPU model stays resident for the next chunk.
+
         Args:
             chunk: Chunk to transcribe
 
@@ -185,15 +661,12 @@ class TranscriptionEngine:
             Updated chunk
         """
         try:
-            import whisper
+            if self.cpu_model is None:
+                import whisper
+                logger.info(f"Loading Whisper model '{self.model_name}' on cpu (fallback)")
+                self.cpu_model = whisper.load_model(self.model_name, device="cpu")
 
-            # Unload GPU model
-            self.unload_model()
-
-            # Load CPU model
-            cpu_model = whisper.load_model(self.model_name, device="cpu")
-
-            result = cpu_model.transcribe(
+            result = self.cpu_model.transcribe(
                 str(chunk.file_path),
                 language=self.language,
                 task="transcribe",
@@ -201,30 +674,18 @@ class TranscriptionEngine:
             )
 
             # Extract segments
-            segments = []
-            for seg in result.get("segments", []):
-                start = chunk.start_time + seg["start"]
-                end = chunk.start_time + seg["end"]
-                segments.append(TranscriptionSegment(
-                    start=start,
-                    end=end,
-                    text=seg["text"].strip(),
-                ))
+            st = chunk.start_time
+            segments = [
+                TranscriptionSegment(start=st + seg["start"], end=st + seg["end"], text=seg["text"].strip())
+                for seg in result.get("segments", ())
+            ]
 
             chunk.text = result.get("text", "").strip()
             chunk.segments = segments
             chunk.status = ChunkStatus.COMPLETED
 
-            from datetime import datetime
             chunk.completed_at = datetime.now()
 
-            # Clean up CPU model
-            del cpu_model
-            gc.collect()
-
-            # Reload GPU model for next chunk
-            self.load_model()
-
             return chunk
 
         except Exception as e:
@@ -253,27 +714,55 @@ class TranscriptionEngine:
 
         total = len(chunks)
         completed = 0
+        transcribed = 0
 
+        # Skip already completed chunks (for resume)
         for chunk in chunks:
-            # Skip already completed chunks (for resume)
             if chunk.status == ChunkStatus.COMPLETED:
                 completed += 1
                 if progress_callback:
                     progress_callback(completed, total)
-                continue
-
-            # Transcribe chunk
-            chunk = self.transcribe_chunk(chunk)
-
-            # Checkpoint
-            if checkpoint_callback:
-                checkpoint_callback(chunk)
 
-            completed += 1
-            if progress_callback:
-                progress_callback(completed, total)
-
-            # Clean up memory between chunks
-            cleanup_gpu_memory()
+        packs = self._pack_chunks([c for c in chunks if c.status != ChunkStatus.COMPLETED])
+        next_packs = iter(packs[1:])
+
+        # Decode the next pack's audio on a worker thread while the model
+        # is busy with the current one
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="bout-audio") as loader:
+            audio_future = self._prefetch_audio(loader, packs[0] if packs else None)
+
+            for pack in packs:
+                audio = None
+                offsets = None
+                if audio_future is not None:
+                    try:
+                        audio, offsets = audio_future.result()
+                    except Exception as e:
+                        # Let transcribe_chunk read the file and report errors
+                        logger.debug(f"Audio prefetch failed for chunk {pack[0].index}: {e}")
+                audio_future = self._prefetch_audio(loader, next(next_packs, None))
+
+                # Transcribe chunk(s)
+                if len(pack) > 1 and audio is not None:
+                    done = self._transcribe_pack(pack, audio, offsets)
+                else:
+                    done = [self.transcribe_chunk(chunk, audio=audio) for chunk in pack]
+                del audio
+
+                for chunk in done:
+                    # Checkpoint
+                    if checkpoint_callback:
+                        checkpoint_callback(chunk)
+
+                    completed += 1
+                    transcribed += 1
+                    if progress_callback:
+                        progress_callback(completed, total)
+
+                    # Releasing cached blocks defeats the allocator, so only do it
+                    # occasionally or when the cache is close to filling the GPU
+                    if (transcribed % GPU_CLEANUP_INTERVAL == 0
+                            or get_gpu_reserved_fraction() > GPU_RESERVED_THRESHOLD):
+                        cleanup_gpu_memory()
 
         return chunks
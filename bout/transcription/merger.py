@@ -3,14 +3,20 @@ Chunk transcription merging.
 
 Handles overlap deduplication and timestamp adjustment.
 """
+import heapq
+import re
 from typing import List
 from difflib import SequenceMatcher
 
+import numpy as np
+
 from ..core.types import Chunk, TranscriptionSegment
 from ..logging import get_logger
 
 logger = get_logger("transcription.merger")
 
+_WS = re.compile(r"\s+")
+
 
 class ChunkMerger:
     """
@@ -44,8 +50,9 @@ class ChunkMerger:
         if not chunks:
             return "", []
 
-        # Sort by index
-        chunks = sorted(chunks, key=lambda c: c.index)
+        # Sort by index (callers normally pass chunks in order already)
+        if any(a.index > b.index for a, b in zip(chunks, chunks[1:])):
+            chunks = sorted(chunks, key=lambda c: c.index)
 
         # Filter to completed chunks only
         completed = [c for c in chunks if c.text is not None]
@@ -58,101 +65,74 @@ class ChunkMerger:
 
         logger.info(f"Merging {len(completed)} chunk transcriptions")
 
-        all_segments: List[TranscriptionSegment] = []
-        full_text_parts: List[str] = []
+        per_chunk_segments: List[List[TranscriptionSegment]] = []
 
+        last = len(completed) - 1
         for i, chunk in enumerate(completed):
-            if i == 0:
-                # First chunk: include everything
-                segments = self._filter_segments_first_chunk(chunk)
-            elif i == len(completed) - 1:
-                # Last chunk: skip overlap at start
-                segments = self._filter_segments_last_chunk(chunk)
-            else:
-                # Middle chunks: skip overlap at both ends
-                segments = self._filter_segments_middle_chunk(chunk)
-
-            all_segments.extend(segments)
-            chunk_text = " ".join(s.text for s in segments)
-            full_text_parts.append(chunk_text)
+            segments = self._filter_segments(chunk, is_first=i == 0, is_last=i == last)
 
-        # Sort all segments by start time
-        all_segments.sort(key=lambda s: s.start)
+            per_chunk_segments.append(segments)
 
-        # Join text parts
-        full_text = " ".join(full_text_parts)
+        # Each chunk's segments are already time-ordered, so a k-way merge
+        # gives the same order as a full sort by start time
+        all_segments = list(heapq.merge(*per_chunk_segments, key=lambda s: s.start))
 
-        # Clean up extra whitespace
-        full_text = " ".join(full_text.split())
+        # Join all segment text in one pass and collapse extra whitespace
+        full_text = " ".join(s.text for segments in per_chunk_segments for s in segments)
+        full_text = _WS.sub(" ", full_text).strip()
 
         logger.info(f"Merged result: {len(full_text)} chars, {len(all_segments)} segments")
 
         return full_text, all_segments
 
-    def _filter_segments_first_chunk(self, chunk: Chunk) -> List[TranscriptionSegment]:
-        """
-        Filter segments for first chunk.
-
-        Includes everything up to the overlap boundary.
+    def _filter_segments(
+        self,
+        chunk: Chunk,
+        is_first: bool,
+        is_last: bool,
+    ) -> List[TranscriptionSegment]:
         """
-        cutoff = chunk.end_time - self.overlap_seconds
-        filtered = []
-
-        for seg in chunk.segments:
-            if seg.end <= cutoff:
-                # Fully before cutoff - include
-                filtered.append(seg)
-            elif seg.start < cutoff:
-                # Crosses cutoff - include if midpoint is before cutoff
-                midpoint = (seg.start + seg.end) / 2
-                if midpoint < cutoff:
-                    filtered.append(seg)
+        Filter a chunk's segments to the region not owned by its neighbours.
 
-        return filtered
+        The first chunk keeps everything up to the overlap boundary at its
+        end, the last chunk skips the overlap at its start, and middle chunks
+        skip overlap at both ends. Segments crossing a boundary are kept if
+        their midpoint falls on this chunk's side.
 
-    def _filter_segments_last_chunk(self, chunk: Chunk) -> List[TranscriptionSegment]:
-        """
-        Filter segments for last chunk.
+        Args:
+            chunk: Transcribed chunk
+            is_first: Chunk is the first in the job
+            is_last: Chunk is the last in the job
 
-        Skips overlap at the start.
+        Returns:
+            Segments to keep, in their original order
         """
-        # Account for overlap at start
-        skip_until = chunk.start_time + chunk.overlap_start
-        filtered = []
-
-        for seg in chunk.segments:
-            if seg.start >= skip_until:
-                # Fully after skip point - include
-                filtered.append(seg)
-            elif seg.end > skip_until:
-                # Crosses skip point - include if midpoint is after skip
-                midpoint = (seg.start + seg.end) / 2
-                if midpoint >= skip_until:
-                    filtered.append(seg)
+        segments = chunk.segments
+        if not segments:
+            return []
 
-        return filtered
-
-    def _filter_segments_middle_chunk(self, chunk: Chunk) -> List[TranscriptionSegment]:
-        """
-        Filter segments for middle chunks.
+        count = len(segments)
+        starts = np.fromiter((s.start for s in segments), dtype=np.float64, count=count)
+        ends = np.fromiter((s.end for s in segments), dtype=np.float64, count=count)
+        midpoints = (starts + ends) * 0.5
 
-        Skips overlap at both ends.
-        """
         skip_until = chunk.start_time + chunk.overlap_start
         cutoff = chunk.end_time - self.overlap_seconds
-        filtered = []
-
-        for seg in chunk.segments:
-            midpoint = (seg.start + seg.end) / 2
 
-            # Check if segment is in the valid range
-            if seg.start >= skip_until and seg.end <= cutoff:
-                filtered.append(seg)
-            elif midpoint >= skip_until and midpoint <= cutoff:
-                # Partially in range - include if midpoint is valid
-                filtered.append(seg)
-
-        return filtered
+        if is_first:
+            # Before cutoff, or crossing it with midpoint before
+            mask = (ends <= cutoff) | ((starts < cutoff) & (midpoints < cutoff))
+        elif is_last:
+            # After skip point, or crossing it with midpoint after
+            mask = (starts >= skip_until) | ((ends > skip_until) & (midpoints >= skip_until))
+        else:
+            # Fully in range, or midpoint in range
+            mask = (
+                ((starts >= skip_until) & (ends <= cutoff))
+                | ((midpoints >= skip_until) & (midpoints <= cutoff))
+            )
+
+        return [segments[i] for i in np.flatnonzero(mask)]
 
     def merge_text_simple(self, chunks: List[Chunk]) -> str:
         """
@@ -227,9 +207,19 @@ class ChunkMerger:
             candidate1 = end1[-length:]
             candidate2 = start2[:length]
 
-            ratio = SequenceMatcher(None, candidate1, candidate2).ratio()
+            if candidate1 == candidate2:
+                # Exact match: ratio 1.0, nothing shorter can beat it
+                return length
+
+            # quick_ratio() is a cheap upper bound on ratio(); only pay for
+            # the full O(n*m) comparison when it could win
+            threshold = max(0.8, best_ratio)
+            matcher = SequenceMatcher(None, candidate1, candidate2)
+            if matcher.quick_ratio() <= threshold:
+                continue
 
-            if ratio > 0.8 and ratio > best_ratio:
+            ratio = matcher.ratio()
+            if ratio > threshold:
                 best_ratio = ratio
                 best_overlap = length
 
@@ -1,10 +1,10 @@
 """Utility modules."""
 from .paths import PathManager
-from .ffmpeg import find_ffmpeg, check_ffmpeg
+from .ffmpeg import find_ffmpeg, check_ffmpeg, invalidate_ffmpeg_cache
 from .system import get_memory_info, cleanup_gpu_memory, set_process_priority
 
 __all__ = [
     "PathManager",
-    "find_ffmpeg", "check_ffmpeg",
+    "find_ffmpeg", "check_ffmpeg", "invalidate_ffmpeg_cache",
     "get_memory_info", "cleanup_gpu_memory", "set_process_priority",
 ]
@@ -3,6 +3,8 @@ FFmpeg detection and validation utilities.
 """
 import shutil
 import subprocess
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -25,10 +27,14 @@ FFPROBE_PATHS = [
 ]
 
 
+@lru_cache(maxsize=1)
 def find_ffmpeg() -> Tuple[Optional[str], Optional[str]]:
     """
     Find FFmpeg and FFprobe executables.
 
+    The result is cached; call invalidate_ffmpeg_cache() after installing
+    or moving FFmpeg.
+
     Returns:
         Tuple of (ffmpeg_path, ffprobe_path) or (None, None) if not found
     """
@@ -60,27 +66,51 @@ def find_ffmpeg() -> Tuple[Optional[str], Optional[str]]:
     return ffmpeg_path, ffprobe_path
 
 
-def check_ffmpeg() -> bool:
+@lru_cache(maxsize=1)
+def _probe_ffmpeg() -> Tuple[Optional[str], bool, Optional[bytes]]:
     """
-    Check if FFmpeg is available and working.
+    Run `ffmpeg -version` once.
+
+    Output is kept as raw bytes; only get_ffmpeg_version() decodes it.
 
     Returns:
-        True if FFmpeg is available
+        Tuple of (ffmpeg_path, works, raw first line of output)
     """
     ffmpeg_path, _ = find_ffmpeg()
     if not ffmpeg_path:
-        return False
+        return None, False, None
 
     try:
         result = subprocess.run(
             [ffmpeg_path, "-version"],
             capture_output=True,
-            text=True,
             timeout=10,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
         )
-        return result.returncode == 0
     except (subprocess.SubprocessError, OSError):
-        return False
+        return ffmpeg_path, False, None
+
+    if result.returncode != 0:
+        return ffmpeg_path, False, None
+
+    # First line contains version
+    return ffmpeg_path, True, result.stdout.split(b"\n", 1)[0]
+
+
+def invalidate_ffmpeg_cache():
+    """Forget cached FFmpeg lookup and probe results."""
+    find_ffmpeg.cache_clear()
+    _probe_ffmpeg.cache_clear()
+
+
+def check_ffmpeg() -> bool:
+    """
+    Check if FFmpeg is available and working.
+
+    Returns:
+        True if FFmpeg is available
+    """
+    return _probe_ffmpeg()[1]
 
 
 def get_ffmpeg_version() -> Optional[str]:
@@ -90,25 +120,10 @@ def get_ffmpeg_version() -> Optional[str]:
     Returns:
         Version string or None if not available
     """
-    ffmpeg_path, _ = find_ffmpeg()
-    if not ffmpeg_path:
+    version_line = _probe_ffmpeg()[2]
+    if version_line is None:
         return None
-
-    try:
-        result = subprocess.run(
-            [ffmpeg_path, "-version"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            # First line contains version
-            first_line = result.stdout.split("\n")[0]
-            return first_line
-    except (subprocess.SubprocessError, OSError):
-        pass
-
-    return None
+    return version_line.decode(errors="replace").rstrip("\r")
 
 
 def require_ffmpeg() -> Tuple[str, str]:
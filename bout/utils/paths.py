@@ -7,6 +7,10 @@ import re
 from pathlib import Path
 from typing import Union
 
+# Maps each character not allowed in Windows filenames to "_"
+_UNSAFE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+_UNDERSCORE_RUNS = re.compile(r"_{2,}")
+
 
 class PathManager:
     """Cross-platform path utilities."""
@@ -54,10 +58,11 @@ class PathManager:
         Returns:
             Safe filename string
         """
-        # Remove unsafe characters
-        safe = cls.UNSAFE_CHARS.sub("_", name)
+        # Remove unsafe characters (single-pass table lookup)
+        safe = name.translate(_UNSAFE_TABLE)
         # Replace multiple underscores with single
-        safe = re.sub(r"_+", "_", safe)
+        if "__" in safe:
+            safe = _UNDERSCORE_RUNS.sub("_", safe)
         # Trim leading/trailing underscores
         safe = safe.strip("_")
         # Limit length
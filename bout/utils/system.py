@@ -5,7 +5,23 @@ import gc
 import os
 import sys
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# PyTorch caching-allocator settings, applied before torch is first imported.
+# Expandable segments let the arena grow in place instead of fragmenting on
+# Whisper's variable-size tensors (not supported on Windows); the GC threshold
+# reclaims cached blocks without a full empty_cache().
+_CUDA_ALLOC_CONF = "max_split_size_mb:512,garbage_collection_threshold:0.8"
+if sys.platform != "win32":
+    _CUDA_ALLOC_CONF = "expandable_segments:True," + _CUDA_ALLOC_CONF
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", _CUDA_ALLOC_CONF)
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
 
 
 @dataclass
@@ -18,37 +34,56 @@ class MemoryInfo:
     gpu_name: Optional[str] = None
 
 
+@lru_cache(maxsize=1)
+def _static_memory_info() -> Tuple[float, Optional[int], Optional[str]]:
+    """
+    Query memory facts that don't change while the process runs.
+
+    torch is imported here rather than at module level so importing
+    bout.utils stays cheap for commands that never touch the GPU.
+
+    Returns:
+        Tuple of (system_total_mb, gpu_total_bytes, gpu_name)
+    """
+    system_total = psutil.virtual_memory().total / (1024 * 1024) if PSUTIL_AVAILABLE else 0
+
+    try:
+        import torch
+        if torch.cuda.is_available():
+            props = torch.cuda.get_device_properties(0)
+            return system_total, props.total_memory, props.name
+    except ImportError:
+        pass
+
+    return system_total, None, None
+
+
 def get_memory_info() -> MemoryInfo:
     """
     Get current memory information.
 
+    Totals and the GPU name are cached; only available memory is queried
+    on each call.
+
     Returns:
         MemoryInfo with system and GPU memory stats
     """
+    system_total, gpu_total_bytes, gpu_name = _static_memory_info()
+
     # System memory
-    try:
-        import psutil
-        mem = psutil.virtual_memory()
-        system_total = mem.total / (1024 * 1024)
-        system_available = mem.available / (1024 * 1024)
-    except ImportError:
-        system_total = 0
+    if PSUTIL_AVAILABLE:
+        system_available = psutil.virtual_memory().available / (1024 * 1024)
+    else:
         system_available = 0
 
     # GPU memory
     gpu_total = None
     gpu_available = None
-    gpu_name = None
 
-    try:
+    if gpu_total_bytes is not None:
         import torch
-        if torch.cuda.is_available():
-            gpu_name = torch.cuda.get_device_name(0)
-            props = torch.cuda.get_device_properties(0)
-            gpu_total = props.total_memory / (1024 * 1024)
-            gpu_available = (props.total_memory - torch.cuda.memory_allocated(0)) / (1024 * 1024)
-    except ImportError:
-        pass
+        gpu_total = gpu_total_bytes / (1024 * 1024)
+        gpu_available = (gpu_total_bytes - torch.cuda.memory_allocated(0)) / (1024 * 1024)
 
     return MemoryInfo(
         system_total_mb=system_total,
@@ -59,19 +94,38 @@ def get_memory_info() -> MemoryInfo:
     )
 
 
+def get_gpu_reserved_fraction() -> float:
+    """
+    Get the fraction of GPU memory reserved by PyTorch's caching allocator.
+
+    Returns:
+        Reserved / total memory on device 0, or 0.0 without a CUDA GPU
+    """
+    gpu_total_bytes = _static_memory_info()[1]
+    if not gpu_total_bytes:
+        return 0.0
+
+    import torch
+    return torch.cuda.memory_reserved(0) / gpu_total_bytes
+
+
 def cleanup_gpu_memory():
     """
     Force GPU memory cleanup.
 
-    Should be called between processing chunks to prevent memory accumulation.
+    Releases all cached allocator blocks, which is expensive and makes later
+    allocations slower. Use for OOM recovery and model unloading, not on
+    every chunk.
     """
     gc.collect()
 
     try:
         import torch
         if torch.cuda.is_available():
-            torch.cuda.empty_cache()
+            # Wait for queued kernels first so the blocks they use are free
+            # when the caching allocator releases its cache
             torch.cuda.synchronize()
+            torch.cuda.empty_cache()
     except ImportError:
         pass
 
@@ -83,9 +137,10 @@ def set_process_priority(priority: str = "below_normal"):
     Args:
         priority: One of 'idle', 'below_normal', 'normal', 'above_normal', 'high'
     """
-    try:
-        import psutil
+    if not PSUTIL_AVAILABLE:
+        return
 
+    try:
         priorities = {
             "idle": psutil.IDLE_PRIORITY_CLASS,
             "below_normal": psutil.BELOW_NORMAL_PRIORITY_CLASS,
@@ -97,8 +152,6 @@ def set_process_priority(priority: str = "below_normal"):
         if sys.platform == "win32":
             p = psutil.Process(os.getpid())
             p.nice(priorities.get(priority, psutil.BELOW_NORMAL_PRIORITY_CLASS))
-    except ImportError:
-        pass
     except Exception:
         pass  # Silently ignore priority setting failures
 
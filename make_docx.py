@@ -0,0 +1,83 @@
+"""
+Script para armar el DOCX de la transcripcion a partir del texto plano.
+transcribe_chunks.py lo lanza en otro proceso para no esperar a python-docx.
+
+Uso: python make_docx.py <texto.txt> <salida.docx>
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Mismo log que transcribe_chunks.py. No se importa de ahi para no repetir lo
+# que ese script hace al cargarse (PATH, prioridad, allocator de CUDA)
+LOG_FILE = Path("C:/Users/ghell/bout/logs/transcription_chunks.log")
+
+def log(message: str):
+    """Log a message to file and console."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    line = f"[{timestamp}] {message}"
+    print(line)
+    with open(LOG_FILE, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def split_paragraphs(text: str, max_length: int = 500):
+    """Agrupa las oraciones en parrafos de poco mas de max_length caracteres."""
+    paragraphs = []
+    sentences = []
+    length = 0
+    for sentence in text.split(". "):
+        sentences.append(sentence)
+        length += len(sentence) + 2  # ". "
+        if length > max_length:
+            paragraphs.append((". ".join(sentences) + ". ").strip())
+            sentences = []
+            length = 0
+
+    if sentences:
+        paragraphs.append((". ".join(sentences) + ". ").strip())
+    return paragraphs
+
+def main():
+    text_output = Path(sys.argv[1])
+    docx_output = Path(sys.argv[2])
+
+    with open(text_output, "r", encoding="utf-8") as f:
+        full_text = f.read()
+
+    # Crear documento DOCX
+    try:
+        from docx import Document
+        from docx.shared import Pt, Inches
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+        doc = Document()
+
+        # Titulo
+        title = doc.add_heading("TRANSCRIPCION DE AUDIENCIA", 0)
+        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+        # Info
+        doc.add_paragraph(f"Archivo: (8428-2024) AUDIENCIA CON MENORES DE EDAD 3_12_25.mp4")
+        doc.add_paragraph(f"Fecha de transcripcion: {datetime.now().strftime('%d/%m/%Y %H:%M')}")
+        doc.add_paragraph(f"Duracion: ~40 minutos")
+        doc.add_paragraph("")
+
+        # Contenido
+        doc.add_heading("CONTENIDO", level=1)
+
+        # Agregar texto en parrafos
+        for paragraph in split_paragraphs(full_text):
+            p = doc.add_paragraph(paragraph)
+            p.style.font.size = Pt(11)
+
+        doc.save(str(docx_output))
+        log(f"Documento DOCX guardado en: {docx_output}")
+
+    except Exception as e:
+        log(f"Error creando DOCX: {e}")
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
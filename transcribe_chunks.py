@@ -2,16 +2,34 @@
 Script para transcribir audio en chunks con logging detallado.
 Usa prioridad baja para no congelar la PC.
 """
+import atexit
+import gc
 import os
+import subprocess
 import sys
 import time
 import json
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+# orjson, si esta instalado, serializa varias veces mas rapido que json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Agregar FFmpeg al PATH
 os.environ["PATH"] = "C:\\ffmpeg;" + os.environ.get("PATH", "")
 
+# Configurar el allocator de CUDA antes de importar torch: bloques grandes
+# sin partir y, fuera de Windows, segmentos que crecen en vez de fragmentarse
+_ALLOC_CONF = "max_split_size_mb:128"
+if sys.platform != 'win32':
+    _ALLOC_CONF = "expandable_segments:True," + _ALLOC_CONF
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", _ALLOC_CONF)
+
 # Establecer prioridad baja ANTES de importar torch
 if sys.platform == 'win32':
     import ctypes
@@ -24,95 +42,680 @@ if sys.platform == 'win32':
 LOG_FILE = Path("C:/Users/ghell/bout/logs/transcription_chunks.log")
 LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
+# Un solo handle para todo el proceso, con buffer por linea
+LOG_FH = open(LOG_FILE, "a", encoding="utf-8", buffering=1)
+atexit.register(LOG_FH.close)
+
 def log(message: str):
     """Log a message to file and console."""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     line = f"[{timestamp}] {message}"
     print(line)
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(line + "\n")
+    LOG_FH.write(line + "\n")
+
+# Chunks de hasta 30 s caben en una sola ventana de Whisper. Los consecutivos
+# se juntan en grupos de hasta 30 s (separados por un silencio corto), y con
+# openai-whisper se decodifican BATCH_SIZE grupos por pasada del modelo
+WINDOW_SECONDS = 30.0
+GAP_SECONDS = 0.5
+SAMPLE_RATE = 16000
+BATCH_SIZE = 8
+
+def wav_duration(path: str) -> float:
+    """Duracion en segundos de un wav, leyendo solo la cabecera."""
+    with wave.open(path, "rb") as w:
+        return w.getnframes() / w.getframerate()
+
+def group_short_chunks(short_chunks):
+    """Junta chunks cortos consecutivos en grupos de hasta WINDOW_SECONDS."""
+    groups = []
+    current = []
+    seconds = 0.0
+    for i, chunk_name, chunk_str, duration in short_chunks:
+        joined = seconds + GAP_SECONDS + duration
+        if current and i == current[-1][0] + 1 and joined <= WINDOW_SECONDS:
+            current.append((i, chunk_name, chunk_str))
+            seconds = joined
+        else:
+            if current:
+                groups.append(current)
+            current = [(i, chunk_name, chunk_str)]
+            seconds = duration
+    if current:
+        groups.append(current)
+    return groups
+
+def enable_sdpa():
+    """
+    Hace que la atencion de Whisper use scaled_dot_product_attention de
+    PyTorch (FlashAttention / memory-efficient) en vez de matmul + softmax.
+    """
+    import torch.nn.functional as F
+    from whisper.model import MultiHeadAttention
+
+    if not hasattr(F, "scaled_dot_product_attention"):
+        return  # PyTorch < 2.0
+
+    # Las versiones recientes de whisper ya la traen detras de este flag
+    if hasattr(MultiHeadAttention, "use_sdpa"):
+        MultiHeadAttention.use_sdpa = True
+        return
+
+    def qkv_attention(self, q, k, v, mask=None):
+        n_ctx = q.shape[1]
+        q = q.view(*q.shape[:2], self.n_head, -1).permute(0, 2, 1, 3)
+        k = k.view(*k.shape[:2], self.n_head, -1).permute(0, 2, 1, 3)
+        v = v.view(*v.shape[:2], self.n_head, -1).permute(0, 2, 1, 3)
+        # Con kv-cache cada paso trae un solo token y no necesita mascara
+        out = F.scaled_dot_product_attention(q, k, v, is_causal=mask is not None and n_ctx > 1)
+        # Sin pesos de atencion: solo se usan para timestamps por palabra
+        return out.permute(0, 2, 1, 3).flatten(start_dim=2), None
+
+    MultiHeadAttention.qkv_attention = qkv_attention
+
+def compile_encoder(model, batch_sizes):
+    """
+    Compila el encoder con torch.compile y lo precalienta con cada tamano de
+    lote, para que el primer chunk no pague la compilacion. El encoder siempre
+    recibe 30 s de mel, asi que la forma es fija. Si algo falla (torch viejo,
+    sin Triton) queda el encoder original.
+    """
+    import torch
+
+    encoder = model.encoder
+    try:
+        model.encoder = torch.compile(encoder, mode="reduce-overhead", fullgraph=True, dynamic=False)
+        with torch.inference_mode():
+            for batch_size in batch_sizes:
+                model.encoder(torch.zeros(
+                    batch_size, model.dims.n_mels, 3000, device=model.device, dtype=torch.float16
+                ))
+        log("Encoder compilado con torch.compile")
+    except Exception as e:
+        model.encoder = encoder
+        log(f"torch.compile no disponible, se usa el encoder normal: {e}")
+
+class GraphDecoder:
+    """
+    Decodificacion greedy de lotes con el paso del decoder capturado en un
+    CUDA Graph. El kv-cache de whisper crece con torch.cat en cada token, asi
+    que aca se usa uno fijo de n_text_ctx posiciones: cada paso escribe su
+    posicion y enmascara las siguientes. Las formas no cambian y el paso
+    (todas las capas, supresion de tokens y argmax) se lanza con un replay.
+    """
+
+    def __init__(self, model, batch_size):
+        import torch
+        from whisper.tokenizer import get_tokenizer
+
+        decoder = model.decoder
+        dims = model.dims
+        dev = model.device
+        self.model = model
+        self.batch_size = batch_size
+        self.tokenizer = get_tokenizer(
+            model.is_multilingual, num_languages=model.num_languages, language="es", task="transcribe"
+        )
+        self.prompt = list(self.tokenizer.sot_sequence_including_notimestamps)
+        self.max_tokens = dims.n_text_ctx // 2
+        eot = self.tokenizer.eot
+
+        # Mismos tokens que suprime whisper.decode con suppress_tokens="-1"
+        t = self.tokenizer
+        suppressed = list(t.non_speech_tokens) + [t.transcribe, t.translate, t.sot, t.sot_prev, t.sot_lm]
+        if t.no_speech is not None:
+            suppressed.append(t.no_speech)
+        self.bias = torch.zeros(dims.n_vocab, device=dev)
+        self.bias[suppressed] = float("-inf")
+        # En el primer token tampoco se permite un espacio ni terminar (SuppressBlank)
+        self.first_bias = self.bias.clone()
+        self.first_bias[t.encode(" ") + [eot]] = float("-inf")
+
+        # Entradas, cache y salida del grafo: siempre los mismos tensores
+        n_layers = len(decoder.blocks)
+        self.token = torch.full((batch_size, 1), eot, dtype=torch.long, device=dev)
+        self.position = torch.zeros(1, dtype=torch.long, device=dev)
+        self.logit_bias = self.bias.clone()
+        self.positions = torch.arange(dims.n_text_ctx, device=dev)
+        self.k = torch.zeros(n_layers, batch_size, dims.n_text_ctx, dims.n_text_state, dtype=torch.float16, device=dev)
+        self.v = torch.zeros_like(self.k)
+        self.k_audio = torch.zeros(
+            n_layers, batch_size, dims.n_audio_ctx, dims.n_text_state, dtype=torch.float16, device=dev
+        )
+        self.v_audio = torch.zeros_like(self.k_audio)
+        self.next_token = torch.full((batch_size, 1), eot, dtype=torch.long, device=dev)
+
+        # Calentar en otro stream y capturar
+        with torch.inference_mode():
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream):
+                for _ in range(3):
+                    self._step()
+            torch.cuda.current_stream().wait_stream(stream)
+            self.graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(self.graph):
+                self._step()
+
+    def _attention(self, attn, x, k, v, mask=None):
+        """Atencion de un bloque de whisper contra k y v ya proyectados."""
+        import torch.nn.functional as F
+
+        n_batch, n_ctx, _ = x.shape
+        q = attn.query(x).view(n_batch, n_ctx, attn.n_head, -1).transpose(1, 2)
+        k = k.view(*k.shape[:2], attn.n_head, -1).transpose(1, 2)
+        v = v.view(*v.shape[:2], attn.n_head, -1).transpose(1, 2)
+        out = F.scaled_dot_product_attention(q, k, v, attn_mask=mask)
+        return attn.out(out.transpose(1, 2).flatten(start_dim=2))
+
+    def _step(self):
+        """Un token por audio en self.position; deja el siguiente en self.next_token."""
+        import torch
+
+        decoder = self.model.decoder
+        eot = self.tokenizer.eot
+        x = decoder.token_embedding(self.token) + decoder.positional_embedding.index_select(0, self.position)
+        x = x.to(torch.float16)
+        visible = (self.positions <= self.position).unsqueeze(0)
+
+        for i, block in enumerate(decoder.blocks):
+            h = block.attn_ln(x)
+            self.k[i].index_copy_(1, self.position, block.attn.key(h))
+            self.v[i].index_copy_(1, self.position, block.attn.value(h))
+            x = x + self._attention(block.attn, h, self.k[i], self.v[i], visible)
+            x = x + self._attention(block.cross_attn, block.cross_attn_ln(x), self.k_audio[i], self.v_audio[i])
+            x = x + block.mlp(block.mlp_ln(x))
+
+        x = decoder.ln(x)
+        logits = (x @ decoder.token_embedding.weight.to(x.dtype).T).float()[:, -1] + self.logit_bias
+        # Los audios que ya terminaron siguen emitiendo EOT
+        self.next_token.copy_(torch.where(self.token == eot, eot, logits.argmax(dim=-1, keepdim=True)))
+
+    def decode(self, audio_features):
+        """Transcribe hasta self.batch_size audios (features del encoder) y devuelve los textos."""
+        import torch
+
+        n = len(audio_features)
+        eot = self.tokenizer.eot
+        audio_features = audio_features.to(torch.float16)
+        for i, block in enumerate(self.model.decoder.blocks):
+            self.k_audio[i, :n].copy_(block.cross_attn.key(audio_features))
+            self.v_audio[i, :n].copy_(block.cross_attn.value(audio_features))
+
+        # El prompt entra de a un token, llenando el cache
+        self.logit_bias.copy_(self.bias)
+        for j, token in enumerate(self.prompt):
+            if j == len(self.prompt) - 1:
+                self.logit_bias.copy_(self.first_bias)
+            self.token.fill_(token)
+            self.position.fill_(j)
+            self.graph.replay()
+
+        generated = torch.full((self.batch_size, self.max_tokens), eot, dtype=torch.long, device=self.token.device)
+        for step in range(self.max_tokens):
+            generated[:, step:step + 1].copy_(self.next_token)
+            if bool((self.next_token[:n] == eot).all()):
+                break
+            if step == 0:
+                self.logit_bias.copy_(self.bias)
+            self.token.copy_(self.next_token)
+            self.position.fill_(len(self.prompt) + step)
+            self.graph.replay()
+
+        texts = []
+        for row in generated[:n].tolist():
+            row = row[:row.index(eot)] if eot in row else row
+            texts.append(self.tokenizer.decode(row).strip())
+        return texts
+
+def prepare_graph_decoder(model, batch_size):
+    """GraphDecoder para el modelo, o None si no se puede capturar."""
+    try:
+        graph_decoder = GraphDecoder(model, batch_size)
+        log("Decoder capturado en un CUDA Graph")
+        return graph_decoder
+    except Exception as e:
+        log(f"CUDA Graph no disponible, se usa whisper.decode: {e}")
+        return None
+
+def load_vad():
+    """
+    Carga Silero VAD del paquete silero-vad (el modelo viene dentro del
+    paquete, no se baja nada al correr); None si no esta disponible.
+    """
+    try:
+        from silero_vad import load_silero_vad, get_speech_timestamps
+        vad_model = load_silero_vad()
+    except Exception as e:
+        log(f"VAD no disponible, se transcribe todo el audio: {e}")
+        return None
+    log("Silero VAD cargado")
+    return vad_model, get_speech_timestamps
+
+def trim_silence(audio, vad):
+    """Deja solo los tramos con voz del audio; None si no hay voz."""
+    if vad is None:
+        return audio
+
+    import numpy as np
+    import torch
+
+    vad_model, get_speech_timestamps = vad
+    segments = get_speech_timestamps(
+        torch.from_numpy(audio), vad_model, sampling_rate=SAMPLE_RATE, min_speech_duration_ms=250
+    )
+    if not segments:
+        return None
+    return np.concatenate([audio[t["start"]:t["end"]] for t in segments])
+
+def load_group(group, faster, vad=None):
+    """
+    Devuelve el audio concatenado del grupo (None si no tiene voz) y el
+    offset (s) de cada chunk dentro de ese audio.
+    """
+    import numpy as np
+    if faster:
+        from faster_whisper import decode_audio as load_audio
+    else:
+        from whisper import load_audio
+
+    gap = np.zeros(int(GAP_SECONDS * SAMPLE_RATE), dtype=np.float32)
+    parts = []
+    offsets = []
+    samples = 0
+    for _, _, chunk_str in group:
+        audio = trim_silence(load_audio(chunk_str), vad)
+        offsets.append(samples / SAMPLE_RATE)
+        if audio is None:
+            continue
+        if parts:
+            parts.append(gap)
+            samples += len(gap)
+            offsets[-1] = samples / SAMPLE_RATE
+        parts.append(audio)
+        samples += len(audio)
+    if not parts:
+        return None, offsets
+    return np.concatenate(parts), offsets
+
+def group_mel(group, faster, vad, n_mels):
+    """
+    Log-mel (n_mels, 3000) del audio del grupo (None si no tiene voz) y los
+    offsets de sus chunks. Se guarda en un .mel.npz junto al primer chunk
+    para no decodificar ni calcular el mel otra vez al reanudar. El cache
+    guarda tamano y mtime de cada wav: los chunks de una grabacion nueva
+    pisan los mismos nombres y no deben reusar el mel anterior.
+    """
+    import zipfile
+
+    import numpy as np
+    import whisper
+
+    first = Path(group[0][2])
+    # La clave incluye n_mels: los modelos large-v3 usan 128 bandas, el resto 80
+    vad_suffix = ".vad" if vad is not None else ""
+    cache = first.with_name(f"{first.stem}.{len(group)}.{n_mels}m{vad_suffix}.mel.npz")
+    signature = np.array(
+        [(st.st_size, st.st_mtime_ns) for st in (os.stat(chunk_str) for _, _, chunk_str in group)],
+        dtype=np.int64,
+    )
+    if cache.exists():
+        try:
+            with np.load(cache) as data:
+                if np.array_equal(data["signature"], signature):
+                    mel = data["mel"] if data["voiced"] else None
+                    return mel, data["offsets"].tolist()
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            pass  # Cache viejo, incompleto o corrupto: se vuelve a calcular
+
+    audio, offsets = load_group(group, faster, vad)
+    mel = None
+    if audio is not None:
+        mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(audio), n_mels).numpy().astype(np.float16)
+
+    tmp = cache.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        np.savez(
+            f,
+            mel=mel if mel is not None else np.empty(0, dtype=np.float16),
+            voiced=mel is not None,
+            offsets=np.array(offsets),
+            signature=signature,
+        )
+    os.replace(tmp, cache)
+    return mel, offsets
+
+def stack_mel(mels, host=None):
+    """
+    Apila varios log-mel en (B, n_mels, 3000). Con host (buffer pinned) se
+    escriben ahi en vez de reservar un tensor nuevo.
+    """
+    import torch
+
+    if host is None:
+        return torch.stack([torch.from_numpy(mel) for mel in mels])
+    for k, mel in enumerate(mels):
+        host[k].copy_(torch.from_numpy(mel))
+    return host[:len(mels)]
+
+def prepare(batch, is_long, faster, vad, n_mels, host=None):
+    """
+    Trabajo de CPU de un lote (audio, VAD y log-mel), pensado para correr en
+    otro hilo mientras la GPU transcribe el lote anterior.
+
+    Devuelve los offsets de cada grupo, la entrada de cada grupo (audio, o
+    log-mel en los lotes de openai-whisper; None si no tiene voz) y el lote
+    de log-mel apilado, o None si se transcribe audio.
+    """
+    if faster or is_long:
+        loaded = [load_group(group, faster, vad) for group in batch]
+    else:
+        loaded = [group_mel(group, faster, vad, n_mels) for group in batch]
+
+    inputs = [item for item, _ in loaded]
+    offsets = [offsets for _, offsets in loaded]
+    voiced = [item for item in inputs if item is not None]
+    mel = None
+    if voiced and not faster and not is_long:
+        mel = stack_mel(voiced, host)
+    return offsets, inputs, mel
+
+def transcribe_batch(model, mel, options, dev=None, stream=None, graph_decoder=None):
+    """
+    Decodifica varios audios de hasta 30 s en una sola pasada del modelo.
+    Con dev y stream, el mel se copia de forma asincrona al buffer dev y el
+    encoder corre siempre sobre el buffer completo (filas de mas en cero),
+    asi el encoder compilado ve un solo tamano de lote. Con graph_decoder
+    (GraphDecoder), el decoder corre con replays del CUDA Graph.
+    """
+    import torch
+    import whisper
+
+    n = len(mel)
+    with torch.inference_mode():
+        if dev is None:
+            batch_input = mel.to(model.device)
+        else:
+            with torch.cuda.stream(stream):
+                dev[:n].copy_(mel, non_blocking=True)
+                dev[n:].zero_()
+            torch.cuda.current_stream().wait_stream(stream)
+            batch_input = dev
+        audio_features = model.encoder(batch_input.half())[:n]
+        if graph_decoder is not None and n <= graph_decoder.batch_size:
+            return graph_decoder.decode(audio_features)
+        # whisper.decode acepta las features ya calculadas y no corre el encoder
+        decoded = whisper.decode(model, audio_features, options)
+    return [r.text.strip() for r in decoded]
+
+def record_group(results, group, offsets, text, duration):
+    """
+    Guarda el resultado de un grupo. El texto queda en el primer chunk; el
+    resto queda vacio, con el nombre del grupo y su offset dentro del audio.
+    """
+    timestamp = datetime.now().isoformat()
+    first = group[0][1]
+    for k, ((_, chunk_name, _), offset) in enumerate(zip(group, offsets)):
+        results[chunk_name] = {
+            "text": text if k == 0 else "",
+            "duration": duration if k == 0 else 0.0,
+            "timestamp": timestamp
+        }
+        if len(group) > 1:
+            results[chunk_name].update(group=first, offset=offset)
+
+def transcribe_chunk(model, audio, faster):
+    """Transcribe un chunk (ruta o audio ya cargado) y devuelve el texto."""
+    if faster:
+        # faster-whisper trae Silero VAD: descarta los tramos sin voz
+        segments, _ = model.transcribe(
+            audio,
+            language="es",
+            beam_size=1,
+            vad_filter=True,
+            vad_parameters={"min_speech_duration_ms": 250},
+            condition_on_previous_text=False
+        )
+        return "".join(s.text for s in segments).strip()
+
+    import torch
+
+    # Decodificacion greedy sin reintentos por temperatura (que decodifican
+    # de nuevo con best_of=5) ni condicionar en el texto anterior
+    with torch.inference_mode():
+        result = model.transcribe(
+            audio,
+            language="es",
+            task="transcribe",
+            verbose=False,
+            beam_size=1,
+            best_of=1,
+            temperature=0.0,
+            condition_on_previous_text=False,
+            fp16=True
+        )
+    return result["text"].strip()
+
+def to_json(data, indent=False) -> bytes:
+    """Serializa a JSON en UTF-8, con orjson si esta instalado."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+def from_json(data: bytes):
+    """Lee JSON desde bytes, con orjson si esta instalado."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def save_results(results, results_file, jsonl_file):
+    """
+    Guardar todos los resultados en un solo JSON y borrar el JSONL, que ya
+    queda incluido. El JSON se escribe aparte y se reemplaza de una vez, asi
+    que si el proceso muere antes de borrar el JSONL, reaplicarlo no cambia nada.
+    """
+    tmp = results_file.with_suffix(".tmp")
+    tmp.write_bytes(to_json(results, indent=True))
+    os.replace(tmp, results_file)
+    jsonl_file.unlink(missing_ok=True)
+
+def load_results(results_file, jsonl_file):
+    """Cargar el JSON completo y aplicar encima los registros del JSONL."""
+    results = {}
+    if results_file.exists():
+        try:
+            results = from_json(results_file.read_bytes())
+        except:
+            pass
+
+    if jsonl_file.exists():
+        line = b""
+        with open(jsonl_file, "rb") as f:
+            for line in f:
+                try:
+                    results.update(from_json(line))
+                except ValueError:
+                    pass  # Linea cortada si el proceso murio escribiendo
+
+        # Terminar una linea cortada para que los registros nuevos no se peguen
+        if line and not line.endswith(b"\n"):
+            with open(jsonl_file, "ab") as f:
+                f.write(b"\n")
+    return results
 
 def main():
     chunks_dir = Path("C:/Users/ghell/bout/temp/chunks")
     output_dir = Path("C:/Users/ghell/bout/output")
     results_file = Path("C:/Users/ghell/bout/temp/transcription_results.json")
 
-    # Listar chunks
-    chunks = sorted(chunks_dir.glob("chunk_*.wav"))
+    # Listar chunks (nombre y ruta, calculados una sola vez)
+    chunks = [(p.name, str(p)) for p in sorted(chunks_dir.glob("chunk_*.wav"))]
     log(f"Encontrados {len(chunks)} chunks para transcribir")
 
+    # Cada chunk transcrito se agrega como una linea a este archivo, en vez
+    # de reescribir todos los resultados despues de cada lote. Al terminar se
+    # vuelca todo al JSON y el JSONL se borra
+    jsonl_file = results_file.with_suffix(".jsonl")
+
     # Cargar resultados previos si existen (para continuar si se interrumpe)
-    results = {}
-    if results_file.exists():
-        try:
-            with open(results_file, "r", encoding="utf-8") as f:
-                results = json.load(f)
-            log(f"Cargados {len(results)} resultados previos")
-        except:
-            pass
+    results = load_results(results_file, jsonl_file)
+    if results:
+        log(f"Cargados {len(results)} resultados previos")
 
-    # Importar whisper (esto toma tiempo)
+    # Importar whisper (esto toma tiempo). Se prefiere faster-whisper
+    # (CTranslate2, int8) si esta instalado: mas rapido y con menos VRAM
     log("Importando whisper...")
-    import whisper
+    try:
+        from faster_whisper import WhisperModel
+        faster = True
+    except ImportError:
+        import whisper
+        faster = False
 
     # Cargar modelo
-    log("Cargando modelo whisper 'small' en CUDA (menos VRAM)...")
     start_load = time.time()
-    model = whisper.load_model("small", device="cuda")
+    if faster:
+        log("Cargando modelo faster-whisper 'small' en CUDA (int8_float16)...")
+        model = WhisperModel("small", device="cuda", compute_type="int8_float16", num_workers=1)
+    else:
+        log("Cargando modelo whisper 'small' en CUDA (menos VRAM)...")
+        enable_sdpa()
+        model = whisper.load_model("small", device="cuda")
+        # Pesos en fp16: si quedan en fp32, whisper los convierte en cada capa
+        # al decodificar con fp16=True. Las LayerNorm siguen en fp32 porque
+        # whisper las calcula en float
+        import torch
+        model.half()
+        for module in model.modules():
+            if isinstance(module, torch.nn.LayerNorm):
+                module.float()
+        # Lo que quede en fp32 usa TF32 en los Tensor Cores
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        # Lotes de BATCH_SIZE grupos y chunks sueltos (model.transcribe)
+        compile_encoder(model, sorted({1, BATCH_SIZE}))
     log(f"Modelo cargado en {time.time() - start_load:.1f} segundos")
 
-    # Transcribir cada chunk
-    for i, chunk_path in enumerate(chunks):
-        chunk_name = chunk_path.name
+    # Con openai-whisper, Silero VAD recorta el silencio antes del modelo
+    # (evita pasadas inutiles y alucinaciones en los silencios)
+    vad = None if faster else load_vad()
 
+    # Separar chunks pendientes: los cortos se agrupan, los largos van de a uno
+    total = len(chunks)
+    short_chunks = []
+    long_chunks = []
+    for i, (chunk_name, chunk_str) in enumerate(chunks):
         # Saltar si ya fue transcrito
         if chunk_name in results:
-            log(f"[{i+1}/{len(chunks)}] {chunk_name} - YA TRANSCRITO, saltando")
+            log(f"[{i+1}/{total}] {chunk_name} - YA TRANSCRITO, saltando")
             continue
 
-        log(f"[{i+1}/{len(chunks)}] Transcribiendo {chunk_name}...")
-        start_time = time.time()
-
         try:
-            result = model.transcribe(
-                str(chunk_path),
-                language="es",
-                task="transcribe",
-                verbose=False
-            )
+            duration = wav_duration(chunk_str)
+        except (OSError, wave.Error, EOFError):
+            duration = None
+        if duration is not None and duration <= WINDOW_SECONDS:
+            short_chunks.append((i, chunk_name, chunk_str, duration))
+        else:
+            long_chunks.append((i, chunk_name, chunk_str))
+
+    # Whisper rellena cada entrada a 30 s: un grupo cuesta lo mismo que un chunk
+    groups = group_short_chunks(short_chunks)
+
+    # Trabajos: lotes de grupos (BATCH_SIZE por pasada con openai-whisper;
+    # whisper.decode no existe en faster-whisper) y chunks largos de a uno
+    step = 1 if faster else BATCH_SIZE
+    jobs = [(groups[b:b + step], False) for b in range(0, len(groups), step)]
+    jobs += [([[chunk]], True) for chunk in long_chunks]
+
+    graph_decoder = None
+    if groups and not faster:
+        graph_decoder = prepare_graph_decoder(model, BATCH_SIZE)
+        # Solo se usa el texto: sin tokens de timestamp se decodifica la mitad
+        options = whisper.DecodingOptions(
+            language="es", task="transcribe", beam_size=1, without_timestamps=True, fp16=True
+        )
+    n_mels = None if faster else model.dims.n_mels
+
+    # Buffers fijos para los lotes: dos en memoria pinned (el hilo de
+    # preparacion llena uno mientras el otro se copia) y uno en la GPU
+    host_buffers = [None, None]
+    dev_buffer = copy_stream = None
+    if groups and not faster:
+        import torch
+        shape = (BATCH_SIZE, n_mels, whisper.audio.N_FRAMES)
+        host_buffers = [torch.empty(shape, dtype=torch.float16, pin_memory=True) for _ in range(2)]
+        dev_buffer = torch.empty(shape, dtype=torch.float16, device=model.device)
+        copy_stream = torch.cuda.Stream()
+
+    # Preparar el siguiente trabajo en otro hilo mientras la GPU transcribe
+    with ThreadPoolExecutor(max_workers=1) as executor, \
+            open(jsonl_file, "ab") as jsonl:
+        next_future = None
+        if jobs:
+            next_future = executor.submit(prepare, *jobs[0], faster, vad, n_mels, host_buffers[0])
+
+        for t, (batch, is_long) in enumerate(jobs):
+            current = next_future
+            if t + 1 < len(jobs):
+                next_future = executor.submit(
+                    prepare, *jobs[t + 1], faster, vad, n_mels, host_buffers[(t + 1) % 2]
+                )
+
+            first = batch[0][0][0] + 1
+            last = batch[-1][-1][0] + 1
+            span = f"{first}" if first == last else f"{first}-{last}"
+            names = ", ".join(chunk_name for group in batch for _, chunk_name, _ in group)
+            log(f"[{span}/{total}] Transcribiendo {names}...")
+            start_time = time.time()
+
+            try:
+                batch_offsets, inputs, mel = current.result()
+                voiced = [item for item in inputs if item is not None]
+                if not voiced:
+                    texts = []
+                elif mel is None:
+                    texts = [transcribe_chunk(model, audio, faster) for audio in voiced]
+                else:
+                    texts = transcribe_batch(model, mel, options, dev_buffer, copy_stream, graph_decoder)
+                # Los grupos sin voz quedan con texto vacio
+                texts = iter(texts)
+                texts = [next(texts) if item is not None else "" for item in inputs]
+            except Exception as e:
+                log(f"[{span}/{total}] ERROR en {names}: {e}")
+                continue
 
             elapsed = time.time() - start_time
-            text = result["text"].strip()
+            log(f"[{span}/{total}] Completado en {elapsed:.1f}s")
 
-            log(f"[{i+1}/{len(chunks)}] {chunk_name} completado en {elapsed:.1f}s - {len(text)} caracteres")
+            for group, offsets, text in zip(batch, batch_offsets, texts):
+                record_group(results, group, offsets, text, elapsed / len(batch))
+                extra = f" (+{len(group) - 1})" if len(group) > 1 else ""
+                log(f"[{group[0][0]+1}/{total}] {group[0][1]}{extra} - {len(text)} caracteres")
 
-            # Guardar resultado
-            results[chunk_name] = {
-                "text": text,
-                "duration": elapsed,
-                "timestamp": datetime.now().isoformat()
-            }
+                # Guardar resultados intermedios (por si se interrumpe)
+                for _, chunk_name, _ in group:
+                    record = {chunk_name: results[chunk_name]}
+                    jsonl.write(to_json(record) + b"\n")
+            jsonl.flush()
 
-            # Guardar resultados intermedios (por si se interrumpe)
-            with open(results_file, "w", encoding="utf-8") as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+    # JSON completo, como antes, para quien lea los resultados
+    save_results(results, results_file, jsonl_file)
 
-            # Pausa breve para que el sistema respire
-            time.sleep(1)
-
-        except Exception as e:
-            log(f"[{i+1}/{len(chunks)}] ERROR en {chunk_name}: {e}")
-            continue
+    # Liberar el modelo y la VRAM antes de armar los documentos
+    del model, vad, graph_decoder, host_buffers, dev_buffer
+    gc.collect()
+    if not faster:
+        import torch
+        torch.cuda.empty_cache()
 
     # Combinar todos los resultados
     log("Combinando resultados...")
-    full_text = ""
-    for chunk_path in chunks:
-        chunk_name = chunk_path.name
-        if chunk_name in results:
-            full_text += results[chunk_name]["text"] + " "
-
-    full_text = full_text.strip()
+    full_text = " ".join(
+        results[chunk_name]["text"]
+        for chunk_name, _ in chunks
+        if chunk_name in results and results[chunk_name]["text"]
+    ).strip()
     log(f"Texto total: {len(full_text)} caracteres")
 
     # Guardar texto plano
@@ -121,47 +724,16 @@ def main():
         f.write(full_text)
     log(f"Texto guardado en: {text_output}")
 
-    # Crear documento DOCX
-    try:
-        from docx import Document
-        from docx.shared import Pt, Inches
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-
-        doc = Document()
-
-        # Titulo
-        title = doc.add_heading("TRANSCRIPCION DE AUDIENCIA", 0)
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-        # Info
-        doc.add_paragraph(f"Archivo: (8428-2024) AUDIENCIA CON MENORES DE EDAD 3_12_25.mp4")
-        doc.add_paragraph(f"Fecha de transcripcion: {datetime.now().strftime('%d/%m/%Y %H:%M')}")
-        doc.add_paragraph(f"Duracion: ~40 minutos")
-        doc.add_paragraph("")
-
-        # Contenido
-        doc.add_heading("CONTENIDO", level=1)
-
-        # Agregar texto en parrafos
-        paragraphs = full_text.split(". ")
-        current_para = ""
-        for sentence in paragraphs:
-            current_para += sentence + ". "
-            if len(current_para) > 500:
-                p = doc.add_paragraph(current_para.strip())
-                p.style.font.size = Pt(11)
-                current_para = ""
-
-        if current_para:
-            p = doc.add_paragraph(current_para.strip())
-            p.style.font.size = Pt(11)
-
-        docx_output = output_dir / "(8428-2024) AUDIENCIA_transcripcion_chunks.docx"
-        doc.save(str(docx_output))
-        log(f"Documento DOCX guardado en: {docx_output}")
-
-    except Exception as e:
-        log(f"Error creando DOCX: {e}")
+    # Crear documento DOCX en otro proceso: python-docx puede tardar con
+    # transcripciones largas y el texto plano ya esta disponible
+    docx_output = output_dir / "(8428-2024) AUDIENCIA_transcripcion_chunks.docx"
+    subprocess.Popen([
+        sys.executable,
+        str(Path(__file__).with_name("make_docx.py")),
+        str(text_output),
+        str(docx_output),
+    ])
+    log(f"Generando DOCX en segundo plano: {docx_output}")
 
     log("=== TRANSCRIPCION COMPLETADA ===")
     return 0